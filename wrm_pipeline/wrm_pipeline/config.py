@@ -63,7 +63,7 @@ def get_secret_from_vault(path: str) -> Optional[dict]:
         secret = client.get_secret(path)
         client.close()
         
-        return secret.data
+        return dict(secret.data)
         
     except Exception as e:
         import logging
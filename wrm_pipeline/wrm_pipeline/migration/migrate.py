@@ -202,7 +202,7 @@ class MigrationOrchestrator:
             
             # Test connection
             health = writer.client.get_health()
-            print(f"Vault status: {health.status.value}")
+            print(f"Vault status: {health.status}")
             print(f"Vault version: {health.version}")
             
         except Exception as e:
@@ -401,8 +401,8 @@ class MigrationOrchestrator:
             )
             with writer:
                 health = writer.client.get_health()
-                print(f"   Vault status: {health.status.value}")
-                vault_healthy = health.status.value not in ["sealed", "uninitialized", "unreachable"]
+                print(f"   Vault status: {health.status}")
+                vault_healthy = health.status not in ["sealed", "uninitialized", "unreachable"]
         except Exception as e:
             print(f"   Error: {e}")
             vault_healthy = False
@@ -381,7 +381,7 @@ class VaultSecretWriter:
         
         try:
             secret = self.client.get_secret(normalized_path)
-            return True, secret.data
+            return True, dict(secret.data)
         except Exception as e:
             logger.error(f"Failed to verify secret at {normalized_path}: {e}")
             return False, None
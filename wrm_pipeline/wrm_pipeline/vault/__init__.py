@@ -14,6 +14,9 @@ from wrm_pipeline.wrm_pipeline.vault.exceptions import (
 from wrm_pipeline.wrm_pipeline.vault.models import (
     VaultSecret,
     VaultConnectionConfig,
+    ApproleConnectionConfig,
+    TokenConnectionConfig,
+    KubernetesConnectionConfig,
     SecretMetadata,
     AccessPolicy,
     PolicyRule,
@@ -24,6 +27,8 @@ from wrm_pipeline.wrm_pipeline.vault.models import (
     VaultHealthStatus,
     RotationType,
     AuditOperation,
+    parse_audit_batch,
+    parse_connection_config,
 )
 from wrm_pipeline.wrm_pipeline.vault.resource import (
     VaultSecretsResource,
@@ -40,6 +45,9 @@ __all__ = [
     "VaultError",
     "VaultSecret",
     "VaultConnectionConfig",
+    "ApproleConnectionConfig",
+    "TokenConnectionConfig",
+    "KubernetesConnectionConfig",
     "SecretMetadata",
     "AccessPolicy",
     "PolicyRule",
@@ -50,6 +58,8 @@ __all__ = [
     "VaultHealthStatus",
     "RotationType",
     "AuditOperation",
+    "parse_audit_batch",
+    "parse_connection_config",
     "VaultSecretsResource",
     "VaultSecretsResourceConfig",
     "vault_secrets_resource",
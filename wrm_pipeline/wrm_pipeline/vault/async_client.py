@@ -0,0 +1,225 @@
+"""Asyncio client for reading secrets from HashiCorp Vault.
+
+This module provides an async companion to :class:`VaultClient` for callers
+that fan out over many secrets. Reads go straight to the KV v2 REST API over
+a single HTTP/2 connection, so concurrent requests are multiplexed as
+streams instead of each needing its own socket or thread.
+
+Example:
+    >>> client = VaultClient(config)
+    >>> async with AsyncVaultClient(client) as async_client:
+    ...     secrets = await async_client.aget_secrets(
+    ...         ["bike-data-flow/production/database", "bike-data-flow/production/api"]
+    ...     )
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Optional
+
+import httpx
+
+from wrm_pipeline.wrm_pipeline.vault.client import VaultClient
+from wrm_pipeline.wrm_pipeline.vault.exceptions import (
+    VaultConnectionError,
+    VaultError,
+    VaultPermissionError,
+    VaultSecretNotFoundError,
+)
+from wrm_pipeline.wrm_pipeline.vault.models import VaultSecret
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVaultClient:
+    """Async secret reader sharing authentication and cache with a VaultClient.
+
+    Authentication stays on the synchronous client and its token is reused
+    for every request. Logging in blocks, so it runs on a worker thread
+    whenever the client has no usable token yet.
+    Secrets read here land in the same cache, so sync and async callers
+    benefit from each other's reads.
+
+    Example:
+        >>> async_client = AsyncVaultClient(VaultClient(config))
+        >>> secret = (await async_client.aget_secrets(["app/db"]))["app/db"]
+        >>> await async_client.aclose()
+    """
+
+    def __init__(self, client: VaultClient):
+        """Initialize the async client.
+
+        Args:
+            client: Synchronous client providing configuration, token and cache
+        """
+        self.client = client
+        self.config = client.config
+        self._http: Optional[httpx.AsyncClient] = None
+        # Reads in progress by path, so concurrent misses share one request
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP/2 client."""
+        if self._http is None:
+            headers = {}
+            if self.config.namespace:
+                headers["X-Vault-Namespace"] = self.config.namespace
+            self._http = httpx.AsyncClient(
+                base_url=self.config.vault_addr,
+                http2=True,
+                verify=self.client._verify,
+                headers=headers,
+                timeout=httpx.Timeout(
+                    self.config.read_timeout or self.config.timeout,
+                    connect=self.config.connect_timeout or self.config.timeout,
+                ),
+            )
+        return self._http
+
+    async def aget_secret(self, path: str) -> VaultSecret:
+        """Read a single secret without blocking the event loop.
+
+        Concurrent calls for the same uncached path share one request.
+
+        Args:
+            path: Secret path
+
+        Returns:
+            VaultSecret with the secret data
+
+        Raises:
+            VaultSecretNotFoundError: If secret doesn't exist
+            VaultPermissionError: If the token may not read the secret
+            VaultConnectionError: If Vault is unreachable
+            VaultError: For any other error response
+        """
+        cached = self.client._get_from_cache(path)
+        if cached is not None:
+            return cached
+
+        flight = self._inflight.get(path)
+        if flight is not None:
+            # shield() keeps one cancelled waiter from cancelling the read
+            return await asyncio.shield(flight)
+
+        await self._aensure_authenticated()
+        flight = asyncio.ensure_future(
+            self._afetch_one(path, self.client.client.token)
+        )
+        self._inflight[path] = flight
+        flight.add_done_callback(lambda _: self._inflight.pop(path, None))
+        return await asyncio.shield(flight)
+
+    async def _aensure_authenticated(self) -> None:
+        """Authenticate the synchronous client without blocking the event loop.
+
+        The hvac login is a blocking HTTP call, so it runs on a worker
+        thread; a client that is already authenticated is not handed off.
+        """
+        if not self.client._is_authenticated():
+            await asyncio.to_thread(self.client._ensure_authenticated)
+
+    async def aget_secrets(self, paths: Iterable[str]) -> dict[str, VaultSecret]:
+        """Read several secrets concurrently.
+
+        Cached secrets are returned directly and the remaining paths are
+        fetched concurrently over one connection. As with
+        :meth:`VaultClient.get_secrets`, a failure for one path is logged and
+        the path is left out of the result.
+
+        Args:
+            paths: Secret paths to read
+
+        Returns:
+            Mapping of path to VaultSecret for every path that was read
+        """
+        secrets: dict[str, VaultSecret] = {}
+        misses: list[str] = []
+        for path in dict.fromkeys(paths):
+            try:
+                cached = self.client._get_from_cache(path)
+            except VaultSecretNotFoundError as e:
+                logger.warning("Failed to read secret %s: %s", path, e)
+                continue
+            if cached is not None:
+                secrets[path] = cached
+            else:
+                misses.append(path)
+
+        if not misses:
+            return secrets
+
+        results = await asyncio.gather(
+            *(self.aget_secret(path) for path in misses),
+            return_exceptions=True,
+        )
+        for path, result in zip(misses, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to read secret %s: %s", path, result)
+            else:
+                secrets[path] = result
+
+        return secrets
+
+    async def _afetch_one(self, path: str, token: str) -> VaultSecret:
+        """Fetch a single secret from the KV v2 API and cache it.
+
+        Args:
+            path: Secret path
+            token: Vault token to authenticate the request
+
+        Returns:
+            VaultSecret with the secret data
+
+        Raises:
+            VaultSecretNotFoundError: If secret doesn't exist
+            VaultPermissionError: If the token may not read the secret
+            VaultConnectionError: If Vault is unreachable
+            VaultError: For any other error response
+        """
+        full_path = self.client._normalize_kv_path(path)
+        try:
+            response = await self._get_http().get(
+                f"/v1/{self.client._mount_point}/data/{full_path}",
+                headers={"X-Vault-Token": token},
+            )
+        except httpx.TransportError as e:
+            raise VaultConnectionError(f"Vault server is unreachable: {e}") from e
+
+        if response.status_code == 404:
+            self.client._set_negative_cache(path)
+            raise VaultSecretNotFoundError(
+                path=path,
+                message=f"Secret not found at path: {path}",
+            )
+        if response.status_code == 403:
+            raise VaultPermissionError(path=path, operation="read")
+        if response.is_error:
+            raise VaultError(
+                f"Failed to read secret: HTTP {response.status_code}",
+                details={"path": path, "response": response.text},
+            )
+
+        body = response.json().get("data") or {}
+        secret = VaultSecret(
+            path=path,
+            data=body.get("data") or {},
+            version=(body.get("metadata") or {}).get("version"),
+        )
+        self.client._set_cache(secret)
+        return secret
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection. The synchronous client is left open."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncVaultClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.aclose()
@@ -71,6 +71,10 @@ class AuditOperation(str, Enum):
         return descriptions.get(self.value, "Unknown operation")
 
 
+# Built once at import; parsing looks operations up here for every log line
+_AUDIT_OP_BY_VALUE: dict[str, AuditOperation] = {op.value: op for op in AuditOperation}
+
+
 class AuditLog:
     """Represents a single audit log entry from Vault.
 
@@ -243,21 +247,7 @@ class AuditLog:
     @staticmethod
     def _parse_operation(operation_str: str) -> AuditOperation:
         """Parse operation string to AuditOperation enum."""
-        mapping = {
-            "read": AuditOperation.READ,
-            "write": AuditOperation.WRITE,
-            "update": AuditOperation.UPDATE,
-            "delete": AuditOperation.DELETE,
-            "list": AuditOperation.LIST,
-            "deny": AuditOperation.DENY,
-            "policy_read": AuditOperation.POLICY_READ,
-            "policy_write": AuditOperation.POLICY_WRITE,
-            "auth": AuditOperation.AUTH,
-            "token": AuditOperation.TOKEN,
-            "revoke": AuditOperation.REVOKE,
-            "renew": AuditOperation.RENEW,
-        }
-        return mapping.get(operation_str.lower(), AuditOperation.READ)
+        return _AUDIT_OP_BY_VALUE.get(operation_str.lower(), AuditOperation.READ)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert audit log to dictionary for serialization."""
@@ -337,10 +327,7 @@ class AuditLogCollection:
         op_values = set()
         for op in operations:
             if isinstance(op, str):
-                try:
-                    op_values.add(AuditOperation(op))
-                except ValueError:
-                    op_values.add(op)
+                op_values.add(_AUDIT_OP_BY_VALUE.get(op, op))
             else:
                 op_values.add(op)
 
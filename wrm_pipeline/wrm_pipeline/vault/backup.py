@@ -17,19 +17,28 @@ Example:
 
 """
 
+import asyncio
+import hashlib
+import heapq
 import json
 import logging
 import os
+import queue
 import shutil
 import subprocess
 import threading
 import time
+import types
+from collections import OrderedDict, deque
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional, Protocol
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Protocol
 from uuid import uuid4
 
 import boto3
@@ -145,6 +154,18 @@ class BackupMetadata:
         )
 
 
+class BackupHistoryEntry(NamedTuple):
+    """Record of a single backup execution."""
+
+    backup_type: str
+    timestamp: str
+    success: bool
+    snapshot_id: Optional[str] = None
+    file_size: Optional[int] = None
+    error: Optional[str] = None
+    verified: Optional[bool] = None
+
+
 @dataclass
 class RetentionPolicy:
     """Backup retention policy configuration."""
@@ -581,7 +602,7 @@ class SnapshotManager:
 
         try:
             self.vault_client._ensure_authenticated()
-            client = self.vault_client._get_client()
+            client = self.vault_client.client
 
             # Attempt to create Raft snapshot
             if backup_type == BackupType.FULL:
@@ -656,7 +677,7 @@ class SnapshotManager:
 
         # List all secret mounts
         self.vault_client._ensure_authenticated()
-        client = self.vault_client._get_client()
+        client = self.vault_client.client
 
         mounts_response = client.sys.list_mounted_secrets_engines()
         mounts = mounts_response.get("data", {})
@@ -914,7 +935,7 @@ class SnapshotManager:
 
         # Check Vault status
         health = self.vault_client.get_health()
-        if health.status.value == "sealed":
+        if health.status == "sealed":
             raise VaultError("Vault is sealed, cannot restore")
 
         # Perform restore based on backup type
@@ -935,7 +956,7 @@ class SnapshotManager:
             Restore result dictionary
         """
         self.vault_client._ensure_authenticated()
-        client = self.vault_client._get_client()
+        client = self.vault_client.client
 
         with open(snapshot_path, "rb") as f:
             response = client._adapter.put(
@@ -1130,6 +1151,49 @@ class SnapshotManager:
 # ============================================================================
 
 
+def _compile_due_predicate(
+    minute: int,
+    hour: int,
+    day_of_week: Optional[int] = None,
+    day_of_month: Optional[int] = None,
+) -> Callable[[datetime], bool]:
+    """Build a predicate telling whether a schedule fires at a given minute.
+
+    The schedule fields are bound into a closure, so the scheduler tick
+    doesn't re-read them from the schedule dict, and only the fields the
+    schedule sets are checked.
+
+    Args:
+        minute: Minute (0-59)
+        hour: Hour of day (0-23)
+        day_of_week: Day of week (0=Sunday, 6=Saturday) for weekly schedules
+        day_of_month: Day of month for monthly schedules
+
+    Returns:
+        Function taking a datetime and returning whether the schedule is due
+    """
+    minute, hour = int(minute), int(hour)
+    if day_of_week is not None:
+        # Cron counts days from Sunday, datetime.weekday() from Monday;
+        # shift the target once instead of the weekday on every tick
+        weekday = (int(day_of_week) - 1) % 7
+        if day_of_month is not None:
+            day = int(day_of_month)
+            return lambda dt: (
+                dt.minute == minute
+                and dt.hour == hour
+                and dt.weekday() == weekday
+                and dt.day == day
+            )
+        return lambda dt: (
+            dt.minute == minute and dt.hour == hour and dt.weekday() == weekday
+        )
+    if day_of_month is not None:
+        day = int(day_of_month)
+        return lambda dt: dt.minute == minute and dt.hour == hour and dt.day == day
+    return lambda dt: dt.minute == minute and dt.hour == hour
+
+
 class BackupScheduler:
     """Schedules and manages automated Vault backups.
 
@@ -1160,16 +1224,57 @@ class BackupScheduler:
         """
         self.snapshot_manager = snapshot_manager
         self.notify_on_failure = notify_on_failure
-        self.notify_emails = notify_emails or []
-
-        # Track backup history
-        self._backup_history: list[dict[str, Any]] = []
+        self.notify_emails: tuple[str, ...] = tuple(notify_emails or ())
+
+        # Track backup history. Each thread appends to its own store so
+        # recording never contends; readers merge the stores by timestamp and
+        # keep the newest _history_max entries overall. Stores of finished
+        # threads are folded into _retired. Verification outcomes land
+        # separately, keyed by snapshot ID and bounded like the history,
+        # oldest first.
+        self._tl = threading.local()
+        self._all_stores: list[tuple[threading.Thread, deque[BackupHistoryEntry]]] = []
+        self._retired: deque[BackupHistoryEntry] = deque()
+        self._history_max = 1000
+        self._verified: OrderedDict[str, bool] = OrderedDict()
         self._lock = threading.Lock()
 
+        # Last computed stats as (monotonic time, stats); reset on new history
+        self._stats_cache: Optional[tuple[float, dict[str, Any]]] = None
+
+        # Registered schedules keyed by schedule ID
+        self._schedules: dict[str, dict[str, Any]] = {}
+
+        # Snapshot verification runs in the background (created lazily)
+        self._verify_pool: Optional[ThreadPoolExecutor] = None
+
+        # Scheduled backups are funnelled through a bounded queue drained by a
+        # single worker (started lazily) so simultaneous schedules don't all
+        # hit Vault, disk and network at once
+        self._exec_queue: queue.Queue[Optional[dict[str, Any]]] = queue.Queue(maxsize=32)
+        self._worker: Optional[threading.Thread] = None
+
         # Default backup settings
-        self._default_retention_days = 30
-        self._default_encrypt = True
-        self._default_upload = True
+        self._defaults = types.SimpleNamespace(encrypt=True, upload=True, retention_days=30)
+
+    def _resolve_options(
+        self,
+        encrypt: Optional[bool],
+        upload: Optional[bool],
+        retention_days: Optional[int],
+        retention_multiplier: int = 1,
+    ) -> tuple[bool, bool, int]:
+        """Fill unset backup options from the scheduler defaults.
+
+        Only ``None`` means "use the default", so an explicit
+        ``retention_days=0`` is kept as given.
+        """
+        defaults = self._defaults
+        return (
+            defaults.encrypt if encrypt is None else encrypt,
+            defaults.upload if upload is None else upload,
+            defaults.retention_days * retention_multiplier if retention_days is None else retention_days,
+        )
 
     def schedule_daily(
         self,
@@ -1191,16 +1296,23 @@ class BackupScheduler:
         Returns:
             Schedule identifier
         """
+        encrypt, upload, retention_days = self._resolve_options(
+            encrypt, upload, retention_days
+        )
         schedule_id = f"daily-{uuid4().hex[:8]}"
         schedule = {
             "id": schedule_id,
             "frequency": ScheduleFrequency.DAILY,
             "cron": f"{minute} {hour} * * *",
-            "encrypt": encrypt if encrypt is not None else self._default_encrypt,
-            "upload": upload if upload is not None else self._default_upload,
-            "retention_days": retention_days or self._default_retention_days,
+            "hour": hour,
+            "minute": minute,
+            "due": _compile_due_predicate(minute, hour),
+            "encrypt": encrypt,
+            "upload": upload,
+            "retention_days": retention_days,
             "enabled": True,
         }
+        self._schedules[schedule_id] = schedule
         logger.info(f"Scheduled daily backup at {hour:02d}:{minute:02d}")
         return schedule_id
 
@@ -1226,17 +1338,24 @@ class BackupScheduler:
         Returns:
             Schedule identifier
         """
+        encrypt, upload, retention_days = self._resolve_options(
+            encrypt, upload, retention_days, retention_multiplier=4
+        )
         schedule_id = f"weekly-{uuid4().hex[:8]}"
         schedule = {
             "id": schedule_id,
             "frequency": ScheduleFrequency.WEEKLY,
             "cron": f"{minute} {hour} * * {day_of_week}",
+            "hour": hour,
+            "minute": minute,
             "day_of_week": day_of_week,
-            "encrypt": encrypt if encrypt is not None else self._default_encrypt,
-            "upload": upload if upload is not None else self._default_upload,
-            "retention_days": retention_days or self._default_retention_days * 4,
+            "due": _compile_due_predicate(minute, hour, day_of_week=day_of_week),
+            "encrypt": encrypt,
+            "upload": upload,
+            "retention_days": retention_days,
             "enabled": True,
         }
+        self._schedules[schedule_id] = schedule
         logger.info(f"Scheduled weekly backup on day {day_of_week} at {hour:02d}:{minute:02d}")
         return schedule_id
 
@@ -1262,19 +1381,185 @@ class BackupScheduler:
         Returns:
             Schedule identifier
         """
+        encrypt, upload, retention_days = self._resolve_options(
+            encrypt, upload, retention_days, retention_multiplier=12
+        )
         schedule_id = f"monthly-{uuid4().hex[:8]}"
         schedule = {
             "id": schedule_id,
             "frequency": ScheduleFrequency.MONTHLY,
             "cron": f"{minute} {hour} {day_of_month} * *",
-            "encrypt": encrypt if encrypt is not None else self._default_encrypt,
-            "upload": upload if upload is not None else self._default_upload,
-            "retention_days": retention_days or self._default_retention_days * 12,
+            "hour": hour,
+            "minute": minute,
+            "day_of_month": day_of_month,
+            "due": _compile_due_predicate(minute, hour, day_of_month=day_of_month),
+            "encrypt": encrypt,
+            "upload": upload,
+            "retention_days": retention_days,
             "enabled": True,
         }
+        self._schedules[schedule_id] = schedule
         logger.info(f"Scheduled monthly backup on day {day_of_month} at {hour:02d}:{minute:02d}")
         return schedule_id
 
+    def get_schedule(self, schedule_id: str) -> Optional[dict[str, Any]]:
+        """Get a registered schedule by ID.
+
+        Args:
+            schedule_id: Schedule identifier
+
+        Returns:
+            Schedule dictionary or None if not found
+        """
+        return self._schedules.get(schedule_id)
+
+    def list_schedules(self, enabled_only: bool = False) -> list[dict[str, Any]]:
+        """List registered backup schedules.
+
+        Args:
+            enabled_only: Only include enabled schedules
+
+        Returns:
+            List of schedule dictionaries
+        """
+        schedules = list(self._schedules.values())
+        if enabled_only:
+            schedules = [s for s in schedules if s["enabled"]]
+        return schedules
+
+    def disable_schedule(self, schedule_id: str) -> bool:
+        """Disable a schedule without removing it.
+
+        Args:
+            schedule_id: Schedule identifier
+
+        Returns:
+            True if disabled, False if not found
+        """
+        schedule = self._schedules.get(schedule_id)
+        if schedule is None:
+            return False
+        schedule["enabled"] = False
+        logger.info(f"Disabled backup schedule: {schedule_id}")
+        return True
+
+    def remove_schedule(self, schedule_id: str) -> bool:
+        """Remove a schedule.
+
+        Args:
+            schedule_id: Schedule identifier
+
+        Returns:
+            True if removed, False if not found
+        """
+        if self._schedules.pop(schedule_id, None) is None:
+            return False
+        logger.info(f"Removed backup schedule: {schedule_id}")
+        return True
+
+    def _collect_due_schedules(self, now: Optional[datetime]) -> list[dict[str, Any]]:
+        """Collect enabled schedules firing at ``now`` and mark them as run."""
+        now = now or datetime.utcnow()
+        tick = now.replace(second=0, microsecond=0)
+
+        due = [
+            s for s in self._schedules.values()
+            if s["enabled"] and s.get("last_run") != tick and s["due"](now)
+        ]
+        for schedule in due:
+            schedule["last_run"] = tick
+        return due
+
+    def _run_scheduled_backup(self, schedule: dict[str, Any]) -> dict[str, Any]:
+        """Run the backup for a single schedule."""
+        result = self.run_backup(
+            encrypt=schedule["encrypt"],
+            upload=schedule["upload"],
+            retention_days=schedule["retention_days"],
+        )
+        result["schedule_id"] = schedule["id"]
+        return result
+
+    def run_due_backups(self, now: Optional[datetime] = None) -> list[dict[str, Any]]:
+        """Run all backups whose schedule fires at the current minute.
+
+        Intended to be called once per minute by an external tick (cron,
+        Dagster sensor, etc.). Due schedules are collected in a single pass
+        and executed as one batch.
+
+        Args:
+            now: Tick time (default: current UTC time)
+
+        Returns:
+            List of backup result dictionaries
+        """
+        return [self._run_scheduled_backup(s) for s in self._collect_due_schedules(now)]
+
+    def dispatch_due_backups(self, now: Optional[datetime] = None) -> list[str]:
+        """Queue due backups for execution by the background worker.
+
+        Unlike :meth:`run_due_backups`, this returns immediately. Backups run
+        one at a time; if the queue is full the backup is dropped with a
+        warning rather than piling up unbounded work.
+
+        Args:
+            now: Tick time (default: current UTC time)
+
+        Returns:
+            IDs of the schedules that were queued
+        """
+        self._ensure_worker()
+        queued = []
+        for schedule in self._collect_due_schedules(now):
+            try:
+                self._exec_queue.put_nowait(schedule)
+                queued.append(schedule["id"])
+            except queue.Full:
+                logger.warning(f"Backup scheduler saturated, dropping backup for schedule {schedule['id']}")
+        return queued
+
+    def _ensure_worker(self) -> None:
+        """Start the backup worker thread if it is not running."""
+        if self._worker is None or not self._worker.is_alive():
+            with self._lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(
+                        target=self._run_worker,
+                        name="vault-backup-worker",
+                        daemon=True,
+                    )
+                    self._worker.start()
+
+    def _run_worker(self) -> None:
+        """Execute queued scheduled backups until a ``None`` sentinel arrives."""
+        while True:
+            schedule = self._exec_queue.get()
+            try:
+                if schedule is None:
+                    return
+                self._run_scheduled_backup(schedule)
+            except Exception as e:
+                logger.error(f"Scheduled backup worker error: {e}")
+            finally:
+                self._exec_queue.task_done()
+
+    async def run_due_backups_async(self, now: Optional[datetime] = None) -> list[dict[str, Any]]:
+        """Async variant of :meth:`run_due_backups` that overlaps due backups.
+
+        All due backups are submitted with a single ``asyncio.gather`` so their
+        snapshot I/O runs concurrently on worker threads.
+
+        Args:
+            now: Tick time (default: current UTC time)
+
+        Returns:
+            List of backup result dictionaries
+        """
+        due = self._collect_due_schedules(now)
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self._run_scheduled_backup, s) for s in due)
+        ))
+
     def run_backup(
         self,
         backup_type: BackupType = BackupType.FULL,
@@ -1293,54 +1578,211 @@ class BackupScheduler:
             skip_verification: Skip verification step
 
         Returns:
-            Backup result dictionary
+            Backup result dictionary. Verification runs in the background;
+            call ``result["verify_future"].result()`` to wait for it.
         """
-        result = {
-            "backup_type": backup_type.value,
-            "timestamp": datetime.utcnow().isoformat(),
-            "success": False,
-            "snapshot_id": None,
-            "error": None,
-        }
+        timestamp = datetime.utcnow().isoformat()
+        snapshot_id: Optional[str] = None
+        file_size: Optional[int] = None
+        error: Optional[str] = None
+        success = False
 
         try:
             logger.info(f"Starting {backup_type.value} backup...")
 
+            encrypt, upload, retention_days = self._resolve_options(
+                encrypt, upload, retention_days
+            )
             snapshot = self.snapshot_manager.create_snapshot(
                 backup_type=backup_type,
-                encrypt=encrypt if encrypt is not None else self._default_encrypt,
-                upload=upload if upload is not None else self._default_upload,
-                retention_days=retention_days or self._default_retention_days,
+                encrypt=encrypt,
+                upload=upload,
+                retention_days=retention_days,
             )
 
-            result["snapshot_id"] = snapshot.id
-            result["success"] = True
-            result["file_size"] = snapshot.file_size
-
-            if not skip_verification:
-                self.snapshot_manager.verify_snapshot(snapshot.id)
+            snapshot_id = snapshot.id
+            file_size = snapshot.file_size
+            success = True
 
             logger.success(f"Backup completed successfully: {snapshot.id}")
 
         except Exception as e:
-            result["error"] = str(e)
+            error = str(e)
             logger.error(f"Backup failed: {e}")
 
             if self.notify_on_failure:
                 self._send_failure_notification(e)
 
-        finally:
-            # Record in history
-            with self._lock:
-                self._backup_history.append(result)
+        entry = BackupHistoryEntry(
+            backup_type=backup_type.value,
+            timestamp=timestamp,
+            success=success,
+            snapshot_id=snapshot_id,
+            file_size=file_size,
+            error=error,
+        )
+
+        self._record(entry)
+
+        result = entry._asdict()
+
+        # Verify only after the entry is recorded so the callback can update it
+        if success and not skip_verification:
+            future = self._get_verify_pool().submit(
+                self.snapshot_manager.verify_snapshot, snapshot_id
+            )
+            future.add_done_callback(partial(self._on_verify_done, snapshot_id))
+            result["verify_future"] = future
 
         return result
 
+    async def run_backup_async(
+        self,
+        backup_type: BackupType = BackupType.FULL,
+        encrypt: Optional[bool] = None,
+        upload: Optional[bool] = None,
+        retention_days: Optional[int] = None,
+        skip_verification: bool = False,
+    ) -> dict[str, Any]:
+        """Run a backup without blocking the event loop.
+
+        Snapshot creation is blocking network and disk I/O, so it runs on a
+        worker thread via ``asyncio.to_thread``. See :meth:`run_backup` for
+        arguments and the result format.
+        """
+        return await asyncio.to_thread(
+            self.run_backup,
+            backup_type=backup_type,
+            encrypt=encrypt,
+            upload=upload,
+            retention_days=retention_days,
+            skip_verification=skip_verification,
+        )
+
+    def _get_verify_pool(self) -> ThreadPoolExecutor:
+        """Get or create the background verification pool."""
+        if self._verify_pool is None:
+            with self._lock:
+                if self._verify_pool is None:
+                    self._verify_pool = ThreadPoolExecutor(
+                        max_workers=2,
+                        thread_name_prefix="vault-backup-verify",
+                    )
+        return self._verify_pool
+
+    def _on_verify_done(self, snapshot_id: str, future: Future) -> None:
+        """Record the outcome of a background snapshot verification.
+
+        Args:
+            snapshot_id: ID of the verified snapshot
+            future: Completed verification future
+        """
+        try:
+            verified = bool(future.result())
+            error: Optional[Exception] = None
+        except Exception as e:
+            verified = False
+            error = e
+
+        with self._lock:
+            self._verified[snapshot_id] = verified
+            if len(self._verified) > self._history_max:
+                self._verified.popitem(last=False)
+        self._stats_cache = None
+
+        if not verified:
+            logger.error(f"Backup verification failed for snapshot: {snapshot_id}")
+            if self.notify_on_failure:
+                self._send_failure_notification(
+                    error or VaultError(f"Snapshot verification failed: {snapshot_id}")
+                )
+
+    def close(self) -> None:
+        """Wait for queued backups and verifications, then stop background threads."""
+        if self._worker is not None:
+            self._exec_queue.put(None)
+            self._worker.join()
+            self._worker = None
+        if self._verify_pool is not None:
+            self._verify_pool.shutdown(wait=True)
+            self._verify_pool = None
+
+    def _record(self, entry: BackupHistoryEntry) -> None:
+        """Append a history entry to the calling thread's store.
+
+        Args:
+            entry: History entry to record
+        """
+        store = getattr(self._tl, "store", None)
+        if store is None:
+            store = deque(maxlen=self._history_max)
+            with self._lock:
+                self._retire_dead_stores()
+                self._all_stores.append((threading.current_thread(), store))
+            self._tl.store = store
+        store.append(entry)
+        self._stats_cache = None
+
+    def _retire_dead_stores(self) -> None:
+        """Fold the stores of finished threads into the retired history.
+
+        Must be called with ``_lock`` held.
+        """
+        live: list[tuple[threading.Thread, deque[BackupHistoryEntry]]] = []
+        dead: list[deque[BackupHistoryEntry]] = []
+        for thread, store in self._all_stores:
+            if thread.is_alive():
+                live.append((thread, store))
+            else:
+                dead.append(store)
+        if not dead:
+            return
+        self._all_stores = live
+        # Replaced rather than mutated, so readers may copy it unlocked
+        self._retired = deque(
+            heapq.merge(self._retired, *dead, key=lambda x: x.timestamp),
+            maxlen=self._history_max,
+        )
+
+    def _iter_history(self, newest_first: bool = False) -> Iterator[BackupHistoryEntry]:
+        """Iterate over the newest recorded history, merged by timestamp.
+
+        At most ``_history_max`` entries are yielded, however many threads
+        recorded them.
+
+        Args:
+            newest_first: Yield the most recent entries first
+
+        Yields:
+            History entries with verification results applied
+        """
+        with self._lock:
+            self._retire_dead_stores()
+            stores = [self._retired, *(store for _, store in self._all_stores)]
+            verified = dict(self._verified)
+        # Copy each store so concurrent appends don't break iteration;
+        # every store is already in timestamp order
+        snapshots = [list(store) for store in stores]
+
+        newest = islice(
+            heapq.merge(
+                *(reversed(snap) for snap in snapshots),
+                key=lambda x: x.timestamp,
+                reverse=True,
+            ),
+            self._history_max,
+        )
+        entries = newest if newest_first else reversed(list(newest))
+        for entry in entries:
+            if entry.snapshot_id in verified:
+                entry = entry._replace(verified=verified[entry.snapshot_id])
+            yield entry
+
     def get_backup_history(
         self,
         limit: int = 50,
         status_filter: Optional[str] = None,
-    ) -> list[dict[str, Any]]:
+    ) -> list[BackupHistoryEntry]:
         """Get backup execution history.
 
         Args:
@@ -1348,33 +1790,44 @@ class BackupScheduler:
             status_filter: Filter by status (success, failed)
 
         Returns:
-            List of backup history entries
+            List of backup history entries, newest first
         """
-        results = self._backup_history
+        results = self._iter_history(newest_first=True)
 
         if status_filter:
-            results = [r for r in results if r.get("success") == (status_filter == "success")]
+            want_success = status_filter == "success"
+            results = (r for r in results if r.success == want_success)
 
-        return sorted(results, key=lambda x: x["timestamp"], reverse=True)[:limit]
+        return list(islice(results, limit))
 
     def get_backup_stats(self) -> dict[str, Any]:
         """Get backup statistics.
 
+        Results are cached for one second so frequent pollers share a single
+        computation; recording a backup invalidates the cache.
+
         Returns:
             Dictionary with backup statistics
         """
-        history = self._backup_history
-        successful = [h for h in history if h.get("success")]
-        failed = [h for h in history if not h.get("success")]
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is not None and now - cached[0] < 1.0:
+            return cached[1]
 
-        return {
+        history = list(self._iter_history())
+        successful = [h for h in history if h.success]
+        failed = [h for h in history if not h.success]
+
+        stats = {
             "total_backups": len(history),
             "successful": len(successful),
             "failed": len(failed),
             "success_rate": len(successful) / len(history) * 100 if history else 0,
-            "last_backup": successful[0] if successful else None,
-            "last_failure": failed[0] if failed else None,
+            "last_backup": successful[-1] if successful else None,
+            "last_failure": failed[-1] if failed else None,
         }
+        self._stats_cache = (now, stats)
+        return stats
 
     def _send_failure_notification(self, error: Exception) -> None:
         """Send failure notification.
@@ -1382,12 +1835,15 @@ class BackupScheduler:
         Args:
             error: The error that occurred
         """
-        logger.info(f"Sending failure notification for error: {error}")
+        logger.info("Sending failure notification for error: %s", error)
+
+        if not self.notify_emails:
+            return
 
         # TODO: Implement email/Slack notifications
         # This is a placeholder for the notification logic
         for email in self.notify_emails:
-            logger.info(f"Would send email to {email}: Backup failed - {error}")
+            logger.info("Would send email to %s: Backup failed - %s", email, error)
 
     def cleanup_old_backups(
         self,
@@ -1409,6 +1865,47 @@ class BackupScheduler:
 # ============================================================================
 
 
+# Vault clients shared by snapshot managers, keyed by (vault_addr, token
+# digest) so the raw token is never kept in a key, least recently used first
+_vault_clients: OrderedDict[tuple[str, str], VaultClient] = OrderedDict()
+_vault_clients_lock = threading.Lock()
+_MAX_VAULT_CLIENTS = 16
+
+
+def _vault_client(vault_addr: str, token: str) -> VaultClient:
+    """Get a shared VaultClient for an address/token pair.
+
+    At most ``_MAX_VAULT_CLIENTS`` clients are kept; the least recently used
+    one is closed when another is added. A snapshot manager still holding
+    an evicted client reconnects on its next request.
+
+    Args:
+        vault_addr: Vault server address
+        token: Vault authentication token
+
+    Returns:
+        VaultClient reused across snapshot managers with the same credentials
+    """
+    key = (vault_addr, hashlib.blake2b(token.encode(), digest_size=16).hexdigest())
+    with _vault_clients_lock:
+        client = _vault_clients.get(key)
+        if client is not None:
+            _vault_clients.move_to_end(key)
+            return client
+        config = VaultConnectionConfig(
+            vault_addr=vault_addr, auth_method="token", token=token
+        )
+        client = _vault_clients[key] = VaultClient(config)
+        evicted = (
+            _vault_clients.popitem(last=False)[1]
+            if len(_vault_clients) > _MAX_VAULT_CLIENTS
+            else None
+        )
+    if evicted is not None:
+        evicted.close()
+    return client
+
+
 def create_snapshot_manager(
     vault_addr: str,
     vault_token: str,
@@ -1428,12 +1925,7 @@ def create_snapshot_manager(
     Returns:
         Configured SnapshotManager instance
     """
-    config = VaultConnectionConfig(
-        vault_addr=vault_addr,
-        auth_method="token",
-        token=vault_token,
-    )
-    vault_client = VaultClient(config)
+    vault_client = _vault_client(vault_addr, vault_token)
 
     backend: Optional[StorageBackendProtocol] = None
 
@@ -4,18 +4,36 @@ This module provides a high-level client for interacting with HashiCorp Vault,
 including authentication, secret operations, and caching support.
 """
 
+import hashlib
+import heapq
+import json
 import logging
-from datetime import datetime, timedelta
+import math
+import os
+import sys
+import time
+import warnings
+import weakref
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from functools import lru_cache
-from threading import Lock
-from typing import Any, Optional
+from threading import Event, Lock, RLock, Semaphore, Timer
+from typing import Any, Optional, Union
 
 import hvac
+import requests
 from hvac.exceptions import (
+    Forbidden,
+    InternalServerError,
     InvalidPath,
+    RateLimitExceeded,
     VaultDown,
     VaultNotInitialized,
 )
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from wrm_pipeline.wrm_pipeline.vault.exceptions import (
     VaultAuthenticationError,
@@ -26,6 +44,7 @@ from wrm_pipeline.wrm_pipeline.vault.exceptions import (
     VaultUninitializedError,
 )
 from wrm_pipeline.wrm_pipeline.vault.models import (
+    VAULT_HEALTH_STATUS_BY_VALUE,
     AccessPolicy,
     AuditLog,
     AuditOperation,
@@ -41,20 +60,248 @@ from wrm_pipeline.wrm_pipeline.vault.models import (
     VaultHealthStatus,
     VaultSecret,
 )
+from wrm_pipeline.wrm_pipeline.vault.rotation import (
+    RotationHistoryTracker,
+    RotationOrchestrator,
+    RotationScheduler,
+)
 
 logger = logging.getLogger(__name__)
 
+# AppRole tokens shared between clients, keyed by (vault_addr, namespace,
+# role_id). Values are (token, lease_duration, time.monotonic() deadline).
+_token_cache: dict[tuple[str, Optional[str], str], tuple[str, float, float]] = {}
+# Number of open clients using each token, so closing one client never
+# revokes a token another still uses. Guarded by _token_cache_lock.
+_token_holders: dict[str, int] = {}
+_token_cache_lock = Lock()
+
+# Tokens in the token cache file are only reused with at least this many
+# seconds of lease left
+_TOKEN_FILE_MARGIN = 60
+
+
+def _token_file_key(vault_addr: str, namespace: Optional[str], role_id: str) -> str:
+    """Key a token cache file entry without storing the role ID in clear."""
+    digest = hashlib.blake2b(
+        f"{vault_addr}\0{namespace or ''}\0{role_id}".encode(), digest_size=16
+    )
+    return digest.hexdigest()
+
+
+def _read_token_file(path: str) -> dict[str, Any]:
+    """Read the token cache file, returning an empty mapping if unusable."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_token_file(path: str, key: str, token: str, lease_duration: float) -> None:
+    """Add or replace a token in the token cache file.
+
+    The file is written with mode 0600 and swapped into place atomically.
+    """
+    data = _read_token_file(path)
+    data[key] = {
+        "token": token,
+        "lease_duration": lease_duration,
+        "expires_at": time.time() + lease_duration if lease_duration else None,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _renew_in_background(client_ref: "weakref.ref[VaultClient]") -> None:
+    """Renewal timer callback; does nothing if the client was collected."""
+    client = client_ref()
+    if client is not None:
+        client._renew_token()
+
+
+# Number of independently locked cache stripes; a power of two so the shard
+# index is a mask of the key hash
+_CACHE_SHARDS = 16
+
+
+# Pooled HTTP sessions shared by clients of the same Vault server, keyed by
+# (vault_addr, verify, retries), each with the number of clients using it
+_shared_sessions: dict[tuple[str, Any, int], list[Any]] = {}
+_shared_sessions_lock = Lock()
+
+
+def _release_session(key: Optional[tuple[str, Any, int]]) -> None:
+    """Drop one client's hold on a shared session, closing it when unused.
+
+    A ``None`` key (a caller-supplied session) is left alone.
+    """
+    with _shared_sessions_lock:
+        entry = _shared_sessions.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_sessions[key]
+    entry[0].close()
+
+
+def _release_unclosed(
+    vault_addr: str, session_key: Optional[tuple[str, Any, int]], warn: bool = True
+) -> None:
+    """Release the HTTP session of a VaultClient collected without close().
+
+    Also runs at interpreter exit for clients still open then. Emits a
+    ResourceWarning unless ``warn`` is false, since the client should have
+    been closed explicitly; clients owned by the :func:`get_cached_client`
+    registry are closed this way by design.
+    """
+    _release_session(session_key)
+    if not warn:
+        return
+    warnings.warn(
+        f"VaultClient for {vault_addr} was not closed; use it as a context "
+        "manager or call close()",
+        ResourceWarning,
+        stacklevel=2,
+    )
+
+
+# Vault errors retried by VaultClient._with_retry on reads. Connection failures and
+# gateway errors are already retried by the HTTP session's urllib3 Retry.
+_RETRYABLE_ERRORS = (VaultDown, InternalServerError, RateLimitExceeded)
+
+# Cached in place of a secret to remember that a path does not exist
+_NOT_FOUND = object()
+
+# Seconds to reuse the result of list_secrets_for_rotation
+_ROTATION_LIST_TTL = 30
+
+# Vault returns RFC 3339 timestamps with a trailing "Z"; fromisoformat only
+# accepts that suffix natively from Python 3.11
+if sys.version_info >= (3, 11):
+    _parse_timestamp = datetime.fromisoformat
+else:
+
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class CacheEntry:
-    """Represents a cached secret entry."""
+    """Represents a cached secret entry.
+
+    ``expires_at`` is a ``time.monotonic_ns()`` deadline, so expiry is
+    unaffected by wall-clock adjustments. ``referenced`` is set on every
+    cache hit and drives least-recently-used eviction.
+    """
 
-    def __init__(self, secret: VaultSecret, expires_at: datetime):
+    __slots__ = ("secret", "expires_at", "referenced")
+
+    def __init__(self, secret: VaultSecret, expires_at: int):
         self.secret = secret
         self.expires_at = expires_at
+        self.referenced = False
 
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
-        return datetime.utcnow() > self.expires_at
+        return time.monotonic_ns() > self.expires_at
+
+
+class _Flight:
+    """A Vault read in progress that other threads can wait on."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.error: Optional[Exception] = None
+        self.result: Optional[VaultSecret] = None
+
+
+class _CacheShard:
+    """One stripe of the secret cache, with its own lock and expiry heap.
+
+    ``entries`` is kept in insertion order and bounded by ``capacity``. When
+    full, entries are evicted approximately least-recently-used with a
+    second-chance (CLOCK) sweep: an entry read since it was last considered
+    moves to the back instead of being evicted. Hits only set a flag, so
+    reads stay lock-free.
+    """
+
+    __slots__ = ("entries", "expiry_heap", "lock", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.entries: dict[str, CacheEntry] = {}
+        # Min-heap of (expires_at, cache_key) used to evict expired entries
+        # without scanning the whole shard; may hold stale pairs
+        self.expiry_heap: list[tuple[int, str]] = []
+        self.lock = RLock()
+
+    def reap_due(self) -> bool:
+        """Check without locking whether the earliest expiry has passed."""
+        try:
+            return self.expiry_heap[0][0] < time.monotonic_ns()
+        except IndexError:
+            # Empty, or emptied by a concurrent writer
+            return False
+
+    def reap(self) -> None:
+        """Evict expired entries.
+
+        Must be called with ``lock`` held. Heap pairs whose key was
+        re-cached with a later expiry are discarded without evicting.
+        """
+        heap = self.expiry_heap
+        if not heap:
+            return
+        now = time.monotonic_ns()
+        while heap and heap[0][0] < now:
+            expires_at, cache_key = heapq.heappop(heap)
+            entry = self.entries.get(cache_key)
+            if entry is not None and entry.expires_at == expires_at:
+                del self.entries[cache_key]
+
+    def store(self, cache_key: str, entry: CacheEntry) -> None:
+        """Insert an entry as most recent, evicting if the shard is full.
+
+        Must be called with ``lock`` held.
+        """
+        entries = self.entries
+        self.reap()
+        # Re-inserting moves the key to the back of the eviction order
+        if entries.pop(cache_key, None) is None:
+            while len(entries) >= self.capacity:
+                self._evict_one()
+        entries[cache_key] = entry
+
+        heap = self.expiry_heap
+        heapq.heappush(heap, (entry.expires_at, cache_key))
+        # Evicted and replaced keys leave stale heap pairs behind; rebuild
+        # the heap before it grows well past the number of live entries
+        if len(heap) > 2 * self.capacity:
+            heap[:] = [(e.expires_at, key) for key, e in entries.items()]
+            heapq.heapify(heap)
+
+    def _evict_one(self) -> None:
+        """Evict the oldest entry not read since it was last considered."""
+        entries = self.entries
+        while True:
+            cache_key = next(iter(entries))
+            entry = entries.pop(cache_key)
+            if not entry.referenced:
+                return
+            # Second chance: clear the flag and move it to the back
+            entry.referenced = False
+            entries[cache_key] = entry
 
 
 class VaultClient:
@@ -73,125 +320,533 @@ class VaultClient:
         ...     role_id="my-role-id",
         ...     secret_id="my-secret-id",
         ... )
-        >>> client = VaultClient(config)
-        >>> secret = client.get_secret("bike-data-flow/production/database")
+        >>> with VaultClient(config) as client:
+        ...     secret = client.get_secret("bike-data-flow/production/database")
+
+    Use the client as a context manager or call :meth:`close` explicitly;
+    a client that is garbage collected while still connected only emits a
+    ``ResourceWarning``.
     """
 
     def __init__(
         self,
         config: VaultConnectionConfig,
         verify: Optional[bool] = None,
+        http_session: Optional[requests.Session] = None,
     ):
         """Initialize Vault client.
 
         Args:
             config: Connection configuration
             verify: TLS verification (overrides config if provided)
+            http_session: HTTP session to send requests through instead of
+                the pooled session shared per server. The caller owns it:
+                it is used as given and not closed by :meth:`close`. Its
+                own adapters decide connection pooling and retries, so
+                ``config.retries`` does not apply to it.
+
+        Raises:
+            ValueError: If ``http_session`` verifies TLS certificates while
+                verification is disabled, or the other way round
         """
         self.config = config
         self._verify = verify if verify is not None else config.verify
+        # hvac sends requests with the session's own verify setting, so a
+        # conflicting session would silently override the configured one
+        if http_session is not None and bool(http_session.verify) != bool(self._verify):
+            raise ValueError(
+                f"http_session.verify={http_session.verify!r} conflicts with "
+                f"verify={self._verify!r}; configure TLS verification on the "
+                "session to match"
+            )
         self._client: Optional[hvac.Client] = None
+        self._session: Optional[requests.Session] = None
+        self._http_session = http_session
+        # Key of the shared pooled session; None when the caller supplies one
+        self._session_key: Optional[tuple[str, Any, int]] = (
+            None
+            if http_session is not None
+            else (config.vault_addr, self._verify, config.retries)
+        )
+        # KV v2 secrets engine mount used for all secret operations
+        self._mount_point = "secret"
+        self._finalizer: Optional[weakref.finalize] = None
+        # Set by get_cached_client, whose registry keeps the client open for
+        # the life of the process
+        self._registry_owned = False
+        # (monotonic time, paths) from the last list_secrets_for_rotation call
+        self._rotation_secrets_cache: Optional[tuple[float, list[str]]] = None
         self._auth_lock = Lock()
-        self._cache: dict[str, CacheEntry] = {}
-        self._cache_lock = Lock()
-        self._initialized = False
-
-    def _get_client(self) -> hvac.Client:
+        # (lease_duration, monotonic deadline) of a renewable login token
+        self._lease: Optional[tuple[float, float]] = None
+        # Background timer renewing the login token before it expires
+        self._renew_timer: Optional[Timer] = None
+        # Token this client is counted as a user of in _token_holders
+        self._held_token: Optional[str] = None
+        # Secret cache striped by key hash so writers to different paths
+        # don't contend on a single lock; cache_max is split across shards
+        self._shard_capacity = -(-config.cache_max // _CACHE_SHARDS)
+        self._shards = [_CacheShard(self._shard_capacity) for _ in range(_CACHE_SHARDS)]
+        # Vault reads in progress by path, so concurrent cache misses for the
+        # same secret trigger a single read
+        # Reads in progress keyed by (normalized path, version)
+        self._inflight: dict[tuple[str, Optional[int]], _Flight] = {}
+        self._inflight_lock = Lock()
+        # Worker pool for batch secret reads (created lazily)
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+        # Set once authenticated; lets callers skip the auth lock entirely
+        self._ready = Event()
+
+    @property
+    def client(self) -> hvac.Client:
         """Get or create the underlying hvac client."""
-        if self._client is None:
-            with self._auth_lock:
-                if self._client is None:
-                    self._client = hvac.Client(
-                        url=self.config.vault_addr,
-                        verify=self._verify,
-                        timeout=self.config.timeout,
-                    )
-        return self._client
+        client = self._client
+        if client is not None:
+            return client
+        with self._auth_lock:
+            if self._client is None:
+                self._session = self._http_session or self._acquire_session()
+                self._client = hvac.Client(
+                    url=self.config.vault_addr,
+                    verify=self._verify,
+                    timeout=(
+                        self.config.connect_timeout or self.config.timeout,
+                        self.config.read_timeout or self.config.timeout,
+                    ),
+                    session=self._session,
+                )
+                self._finalizer = weakref.finalize(
+                    self,
+                    _release_unclosed,
+                    self.config.vault_addr,
+                    self._session_key,
+                    not self._registry_owned,
+                )
+            return self._client
+
+    def _acquire_session(self) -> requests.Session:
+        """Get the pooled session shared with other clients of this server.
+
+        Clients with the same address, TLS verification and retry settings
+        reuse one session, so their keep-alive connections (and completed
+        TLS handshakes) are shared.
+        """
+        with _shared_sessions_lock:
+            entry = _shared_sessions.get(self._session_key)
+            if entry is None:
+                entry = _shared_sessions[self._session_key] = [
+                    self._create_session(),
+                    0,
+                ]
+            entry[1] += 1
+            return entry[0]
+
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with a connection pool sized for parallel reads.
+
+        Keep-alive connections are reused across requests, and transient
+        gateway errors are retried with backoff.
+        """
+        retry = Retry(
+            total=self.config.retries,
+            backoff_factor=0.2,
+            # 503 (sealed/standby) is left to _with_retry so it still surfaces
+            # as VaultDown; after the last retry the response is returned for
+            # hvac to raise its own error instead of a RetryError
+            status_forcelist=[502, 504],
+            raise_on_status=False,
+            # Only idempotent reads are resent after a read error or gateway
+            # error, since a write may already have been applied. Connection
+            # errors, raised before anything is sent, are retried for all.
+            allowed_methods=frozenset(["GET", "HEAD", "LIST"]),
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        session = requests.Session()
+        # hvac takes verification from a supplied session rather than its
+        # own verify argument
+        session.verify = self._verify
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _authenticate(self) -> None:
         """Authenticate with Vault using the configured method."""
-        client = self._get_client()
+        try:
+            handler = self._AUTH_METHODS[self.config.auth_method]
+        except KeyError:
+            raise VaultAuthenticationError(
+                f"Unsupported authentication method: {self.config.auth_method}"
+            ) from None
+        handler(self, self.client)
+        self._hold_token(self.client.token)
 
-        if self.config.auth_method == "approle":
-            if not self.config.role_id:
-                raise VaultAuthenticationError(
-                    "AppRole authentication requires role_id"
-                )
-            if not self.config.secret_id:
-                raise VaultAuthenticationError(
-                    "AppRole authentication requires secret_id"
-                )
-            response = client.auth.approle.login(
-                role_id=self.config.role_id,
-                secret_id=self.config.secret_id,
+        self._schedule_renewal()
+        self._ready.set()
+        logger.info("Successfully authenticated to Vault")
+
+    def _auth_approle(self, client: hvac.Client) -> None:
+        """Authenticate with AppRole, reusing a shared token if available."""
+        if not self.config.role_id:
+            raise VaultAuthenticationError(
+                "AppRole authentication requires role_id"
             )
-            if "auth" not in response or "client_token" not in response.get(
-                "auth", {}
-            ):
-                raise VaultAuthenticationError(
-                    "AppRole login did not return a token"
-                )
-            client.token = response["auth"]["client_token"]
+        if not self.config.secret_id:
+            raise VaultAuthenticationError(
+                "AppRole authentication requires secret_id"
+            )
+        token_key = self._token_key()
+        cached = _token_cache.get(token_key)
+        if cached is None or cached[2] <= time.monotonic():
+            cached = self._load_persisted_token(client)
+            if cached is None:
+                cached = self._approle_login(client)
+            with _token_cache_lock:
+                _token_cache[token_key] = cached
+        token, lease_duration, deadline = cached
+        client.token = token
+        self._lease = (lease_duration, deadline)
+
+    def _auth_token(self, client: hvac.Client) -> None:
+        """Authenticate with a configured token."""
+        if not self.config.token:
+            raise VaultAuthenticationError(
+                "Token authentication requires token"
+            )
+        client.token = self.config.token
+
+    def _auth_kubernetes(self, client: hvac.Client) -> None:
+        """Authenticate with the pod's Kubernetes service account."""
+        # Kubernetes auth uses the service account token automatically
+        # mounted at /var/run/secrets/kubernetes.io/serviceaccount/token
+        response = client.auth.kubernetes.login(role=self.config.role_id or "default")
+        if "auth" not in response or "client_token" not in response.get(
+            "auth", {}
+        ):
+            raise VaultAuthenticationError(
+                "Kubernetes login did not return a token"
+            )
+        client.token = response["auth"]["client_token"]
+        lease_duration = response["auth"].get("lease_duration") or 0
+        self._lease = (
+            (lease_duration, time.monotonic() + lease_duration)
+            if lease_duration
+            else None
+        )
 
-        elif self.config.auth_method == "token":
-            if not self.config.token:
-                raise VaultAuthenticationError(
-                    "Token authentication requires token"
-                )
-            client.token = self.config.token
-
-        elif self.config.auth_method == "kubernetes":
-            # Kubernetes auth uses the service account token automatically
-            # mounted at /var/run/secrets/kubernetes.io/serviceaccount/token
-            response = client.auth.kubernetes.login(role=self.config.role_id or "default")
-            if "auth" not in response or "client_token" not in response.get(
-                "auth", {}
-            ):
-                raise VaultAuthenticationError(
-                    "Kubernetes login did not return a token"
-                )
-            client.token = response["auth"]["client_token"]
+    # Login handler per auth_method. Subclasses can support further methods
+    # by extending this mapping with their own handlers.
+    _AUTH_METHODS: dict[str, Callable[["VaultClient", hvac.Client], None]] = {
+        "approle": _auth_approle,
+        "token": _auth_token,
+        "kubernetes": _auth_kubernetes,
+    }
 
-        else:
+    def _approle_login(self, client: hvac.Client) -> tuple[str, float, float]:
+        """Log in with AppRole.
+
+        Returns:
+            Tuple of (token, lease_duration, monotonic deadline)
+        """
+        response = client.auth.approle.login(
+            role_id=self.config.role_id,
+            secret_id=self.config.secret_id,
+        )
+        if "auth" not in response or "client_token" not in response.get(
+            "auth", {}
+        ):
             raise VaultAuthenticationError(
-                f"Unsupported authentication method: {self.config.auth_method}"
+                "AppRole login did not return a token"
+            )
+        token = response["auth"]["client_token"]
+        lease_duration = response["auth"].get("lease_duration") or 0
+        self._persist_token(token, lease_duration)
+        # A zero lease duration means the token never expires
+        deadline = time.monotonic() + lease_duration if lease_duration else math.inf
+        return token, lease_duration, deadline
+
+    def _persist_token(self, token: str, lease_duration: float) -> None:
+        """Save a token to the token cache file, if one is configured."""
+        if not self.config.token_cache_file:
+            return
+        try:
+            _write_token_file(
+                os.path.expanduser(self.config.token_cache_file),
+                _token_file_key(*self._token_key()),
+                token,
+                lease_duration,
             )
+        except OSError as e:
+            logger.warning("Could not write Vault token cache file: %s", e)
 
-        self._initialized = True
-        logger.info("Successfully authenticated to Vault")
+    def _load_persisted_token(
+        self, client: hvac.Client
+    ) -> Optional[tuple[str, float, float]]:
+        """Load a still-valid token from the token cache file.
+
+        The token is checked with a lookup-self call before being trusted.
+
+        Returns:
+            Tuple of (token, lease_duration, monotonic deadline), or None
+        """
+        if not self.config.token_cache_file:
+            return None
+        entry = _read_token_file(os.path.expanduser(self.config.token_cache_file)).get(
+            _token_file_key(*self._token_key())
+        )
+        if not isinstance(entry, dict) or not entry.get("token"):
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is None:
+            deadline = math.inf
+        else:
+            remaining = expires_at - time.time()
+            if remaining <= _TOKEN_FILE_MARGIN:
+                return None
+            deadline = time.monotonic() + remaining
+
+        client.token = entry["token"]
+        try:
+            if not client.is_authenticated():
+                return None
+        except Exception as e:
+            logger.debug("Cached Vault token rejected: %s", e)
+            return None
+
+        logger.info("Reusing Vault token from token cache file")
+        return entry["token"], entry.get("lease_duration") or 0, deadline
+
+    def _is_authenticated(self) -> bool:
+        """Check without locking whether the client holds a usable token.
+
+        When this is true, :meth:`_ensure_authenticated` returns without
+        blocking.
+        """
+        lease = self._lease
+        return self._ready.is_set() and (
+            lease is None or lease[1] > time.monotonic()
+        )
 
     def _ensure_authenticated(self) -> None:
-        """Ensure the client is authenticated."""
-        if not self._initialized:
-            self._authenticate()
+        """Ensure the client is authenticated.
+
+        Concurrent first callers authenticate once; the others wait on the
+        auth lock and then find the client ready. The ready flag is only set
+        (as the last step of _authenticate) or cleared while holding the auth
+        lock, so the lock-free check never sees a half-initialized client.
+        """
+        if not self._ready.is_set():
+            # Create the hvac client before taking the auth lock, which the
+            # client property takes as well
+            _ = self.client
+            with self._auth_lock:
+                if not self._ready.is_set():
+                    self._authenticate()
+        elif self._lease is not None and self._lease[1] <= time.monotonic():
+            # Background renewal failed or the process was suspended past
+            # the token's expiry
+            with self._auth_lock:
+                if self._lease is not None and self._lease[1] <= time.monotonic():
+                    self._drop_shared_token()
+                    self._authenticate()
+
+    def _schedule_renewal(self) -> None:
+        """Start a timer renewing the login token at 2/3 of its lease.
+
+        Tokens without a lease (static tokens, or logins that never expire)
+        are not renewed.
+        """
+        if self._renew_timer is not None:
+            self._renew_timer.cancel()
+            self._renew_timer = None
+        if self._lease is None or not math.isfinite(self._lease[1]):
+            return
+        lease_duration, deadline = self._lease
+        delay = max(0.0, deadline - time.monotonic() - lease_duration / 3)
+        # The timer holds a weak reference so it doesn't keep the client alive
+        self._renew_timer = Timer(delay, _renew_in_background, (weakref.ref(self),))
+        self._renew_timer.daemon = True
+        self._renew_timer.start()
+
+    def _renew_token(self) -> None:
+        """Renew the login token, logging in again if Vault refuses.
+
+        Runs on the renewal timer thread under the auth lock, so it never
+        races with a re-authentication in another thread.
+        """
+        with self._auth_lock:
+            # The client was closed after the timer fired
+            if self._client is None or self._lease is None:
+                return
+
+            token_key = self._token_key()
+            if self.config.auth_method == "approle":
+                # Another client sharing this token may have renewed it already
+                cached = _token_cache.get(token_key)
+                if (
+                    cached is not None
+                    and cached[0] == self._client.token
+                    and cached[2] > self._lease[1]
+                ):
+                    self._lease = (cached[1], cached[2])
+                    self._schedule_renewal()
+                    return
+
+            try:
+                response = self._client.auth.token.renew_self()
+            except Forbidden as e:
+                logger.warning("Vault refused token renewal, logging in again: %s", e)
+                self._drop_shared_token()
+                try:
+                    self._authenticate()
+                except Exception as e:
+                    # Leave it to the next caller to authenticate on demand
+                    logger.error("Failed to log in to Vault again: %s", e)
+                    self._lease = None
+                    self._ready.clear()
+                return
+            except Exception as e:
+                # Retried by _ensure_authenticated once the token expires
+                logger.warning("Failed to renew Vault token: %s", e)
+                return
+
+            lease_duration = response["auth"]["lease_duration"]
+            deadline = time.monotonic() + lease_duration
+            self._lease = (lease_duration, deadline)
+            if self.config.auth_method == "approle":
+                with _token_cache_lock:
+                    _token_cache[token_key] = (
+                        self._client.token,
+                        lease_duration,
+                        deadline,
+                    )
+                self._persist_token(self._client.token, lease_duration)
+            self._schedule_renewal()
+            logger.debug("Renewed Vault token")
+
+    def _drop_shared_token(self) -> None:
+        """Remove this client's token from the shared AppRole token cache."""
+        if self.config.auth_method != "approle" or self._client is None:
+            return
+        token_key = self._token_key()
+        with _token_cache_lock:
+            cached = _token_cache.get(token_key)
+            if cached is not None and cached[0] == self._client.token:
+                del _token_cache[token_key]
+
+    def _token_key(self) -> tuple[str, Optional[str], str]:
+        """Key of this client's AppRole login in the shared token cache."""
+        return (self.config.vault_addr, self.config.namespace, self.config.role_id)
+
+    def _hold_token(self, token: Optional[str]) -> None:
+        """Count this client as a user of a token, releasing its previous one."""
+        self._release_token()
+        if token is None:
+            return
+        with _token_cache_lock:
+            _token_holders[token] = _token_holders.get(token, 0) + 1
+        self._held_token = token
+
+    def _release_token(self) -> int:
+        """Stop counting this client as a user of its token.
+
+        Returns:
+            Number of other open clients still using the token
+        """
+        token, self._held_token = self._held_token, None
+        if token is None:
+            return 0
+        with _token_cache_lock:
+            holders = _token_holders.get(token, 1) - 1
+            if holders > 0:
+                _token_holders[token] = holders
+            else:
+                _token_holders.pop(token, None)
+        return holders
 
-    def _get_cache_key(self, path: str) -> str:
-        """Generate cache key for a secret path."""
-        return f"secret:{path}"
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_kv_path(path: str) -> str:
+        """Strip a leading ``secret/data/`` or ``secret/`` mount prefix from a path."""
+        if path.startswith("secret/data/"):
+            return path[len("secret/data/"):]
+        return path.removeprefix("secret/")
+
+    def _shard(self, cache_key: str) -> _CacheShard:
+        """Get the cache shard holding a cache key."""
+        return self._shards[hash(cache_key) & (_CACHE_SHARDS - 1)]
 
     def _get_from_cache(self, path: str) -> Optional[VaultSecret]:
-        """Get secret from cache if not expired."""
-        cache_key = self._get_cache_key(path)
-        with self._cache_lock:
-            entry = self._cache.get(cache_key)
-            if entry is not None and not entry.is_expired():
-                logger.debug(f"Cache hit for {path}")
-                return entry.secret
-            elif entry is not None:
-                logger.debug(f"Cache expired for {path}")
-                del self._cache[cache_key]
+        """Get secret from cache if not expired.
+
+        Hits and plain misses are served without taking the shard lock; the
+        lock is only needed to evict expired entries.
+
+        Entries are keyed by the normalized path, so ``app/db`` and
+        ``secret/data/app/db`` share one entry: every secret lives under the
+        single KV mount, so no prefix is needed to keep keys unique.
+
+        Raises:
+            VaultSecretNotFoundError: If the path is cached as missing
+        """
+        cache_key = self._normalize_kv_path(path)
+        shard = self._shard(cache_key)
+        entry = shard.entries.get(cache_key)
+        # Same check as CacheEntry.is_expired, inlined for the hit path
+        if entry is not None and time.monotonic_ns() <= entry.expires_at:
+            # Only write the flag when it changes, so repeated hits on a hot
+            # entry don't keep dirtying it
+            if not entry.referenced:
+                entry.referenced = True
+            if entry.secret is _NOT_FOUND:
+                logger.debug("Negative cache hit for %s", path)
+                raise VaultSecretNotFoundError(
+                    path=path,
+                    message=f"Secret not found at path: {path}",
+                )
+            logger.debug("Cache hit for %s", path)
+            return entry.secret
+
+        # A plain miss only needs the lock if there is something to reap
+        if entry is None and not shard.reap_due():
+            return None
+
+        with shard.lock:
+            shard.reap()
+            if entry is not None:
+                current = shard.entries.pop(cache_key, None)
+                if current is entry:
+                    logger.debug("Cache expired for %s", path)
+                elif current is not None:
+                    # Refreshed before we took the lock; keep the new entry
+                    shard.entries[cache_key] = current
         return None
 
     def _set_cache(self, secret: VaultSecret) -> None:
         """Cache a secret with TTL."""
-        cache_key = self._get_cache_key(secret.path)
-        expires_at = datetime.utcnow() + timedelta(
-            seconds=self.config.cache_ttl
-        )
-        entry = CacheEntry(secret, expires_at)
-        with self._cache_lock:
-            self._cache[cache_key] = entry
-        logger.debug(f"Cached secret: {secret.path}")
+        self._store_cache_entry(secret.path, secret, self.config.cache_ttl)
+        logger.debug("Cached secret: %s", secret.path)
+
+    def _set_negative_cache(self, path: str) -> None:
+        """Remember that a secret path does not exist for a short TTL.
+
+        The entry is dropped by write_secret like any cached secret, so a
+        path that is created becomes readable immediately.
+        """
+        ttl = min(self.config.cache_ttl, self.config.negative_cache_ttl)
+        if not ttl:
+            return
+        self._store_cache_entry(path, _NOT_FOUND, ttl)
+        logger.debug("Cached missing secret: %s", path)
+
+    def _store_cache_entry(self, path: str, value: Any, ttl: int) -> None:
+        """Store a cache entry expiring after ``ttl`` seconds."""
+        expires_at = time.monotonic_ns() + ttl * 1_000_000_000
+        entry = CacheEntry(value, expires_at)
+        cache_key = self._normalize_kv_path(path)
+        shard = self._shard(cache_key)
+        with shard.lock:
+            shard.store(cache_key, entry)
 
     def _clear_cache(self, path: Optional[str] = None) -> None:
         """Clear cache entries.
@@ -199,15 +854,29 @@ class VaultClient:
         Args:
             path: Specific path to clear, or None to clear all
         """
-        with self._cache_lock:
-            if path is None:
-                self._cache.clear()
-                logger.info("Cleared all cached secrets")
-            else:
-                cache_key = self._get_cache_key(path)
-                if cache_key in self._cache:
-                    del self._cache[cache_key]
-                    logger.info(f"Cleared cache for {path}")
+        if path is not None:
+            cache_key = self._normalize_kv_path(path)
+            shard = self._shard(cache_key)
+            with shard.lock:
+                if shard.entries.pop(cache_key, None) is not None:
+                    logger.info("Cleared cache for %s", path)
+            return
+
+        # Lock every shard, always in index order, so the clear is atomic
+        # with respect to writers without risking lock-order deadlocks
+        shards = self._shards
+        for shard in shards:
+            shard.lock.acquire()
+        try:
+            for shard in shards:
+                # Swap rather than clear so lock-free readers holding the old
+                # dict are unaffected
+                shard.entries = {}
+                shard.expiry_heap = []
+        finally:
+            for shard in reversed(shards):
+                shard.lock.release()
+        logger.info("Cleared all cached secrets")
 
     def is_initialized(self) -> bool:
         """Check if Vault is initialized.
@@ -216,13 +885,13 @@ class VaultClient:
             True if Vault is initialized, False otherwise
         """
         try:
-            client = self._get_client()
+            client = self.client
             health = client.sys.read_health_status()
             return health.get("initialized", False)
         except VaultNotInitialized:
             return False
         except Exception as e:
-            logger.error(f"Failed to check Vault initialization: {e}")
+            logger.error("Failed to check Vault initialization: %s", e)
             return False
 
     def get_health(self) -> VaultHealth:
@@ -235,23 +904,20 @@ class VaultClient:
             VaultConnectionError: If Vault is unreachable
         """
         try:
-            client = self._get_client()
+            client = self.client
             status = client.sys.read_health_status()
 
             # Map status to enum
             status_str = status.get("status", "unknown")
-            try:
-                vault_status = VaultHealthStatus(status_str)
-            except ValueError:
-                vault_status = VaultHealthStatus.STANDBY
+            vault_status = VAULT_HEALTH_STATUS_BY_VALUE.get(
+                status_str, VaultHealthStatus.STANDBY
+            )
 
             # Parse server time
             server_time_str = status.get("server_time_utc", "")
             try:
-                server_time = datetime.fromisoformat(
-                    server_time_str.replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
+                server_time = _parse_timestamp(server_time_str)
+            except (ValueError, TypeError, AttributeError):
                 server_time = datetime.utcnow()
 
             return VaultHealth(
@@ -293,26 +959,164 @@ class VaultClient:
             VaultAuthenticationError: If authentication fails
             VaultConnectionError: If Vault is unreachable
         """
-        # Check cache first
-        if use_cache:
+        if not use_cache:
+            return self._read_secret(path, version, use_cache=False)
+
+        # The cache only holds the latest version of each secret
+        latest = version is None
+        if latest:
             cached = self._get_from_cache(path)
             if cached is not None:
                 return cached
 
+        # Only one thread fetches a given version of a secret; the others
+        # wait for it and share its result (or its error)
+        flight_key = (self._normalize_kv_path(path), version)
+        with self._inflight_lock:
+            flight = self._inflight.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[flight_key] = _Flight()
+
+        if leader:
+            try:
+                # The previous fetch may have finished just before we got here
+                secret = self._get_from_cache(path) if latest else None
+                if secret is None:
+                    secret = self._read_secret(path, version, use_cache=True)
+                flight.result = secret
+                return secret
+            except Exception as e:
+                flight.error = e
+                raise
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[flight_key]
+                flight.done.set()
+
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def _get_fetch_pool(self) -> ThreadPoolExecutor:
+        """Get or create the worker pool used for batch secret reads."""
+        if self._fetch_pool is None:
+            with self._auth_lock:
+                if self._fetch_pool is None:
+                    self._fetch_pool = ThreadPoolExecutor(
+                        max_workers=self.config.max_parallel,
+                        thread_name_prefix="vault-fetch",
+                    )
+        return self._fetch_pool
+
+    def get_secrets(
+        self,
+        paths: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> dict[str, VaultSecret]:
+        """Read several secrets, fetching cache misses concurrently.
+
+        Cached secrets are returned directly; the remaining paths are read
+        in parallel (up to ``config.max_parallel`` at a time). A failure for
+        one path does not affect the others: it is logged and the path is
+        left out of the result.
+
+        Args:
+            paths: Secret paths to read
+            max_workers: Maximum concurrent reads for this call; capped at
+                ``config.max_parallel``, the size of the shared worker pool
+
+        Returns:
+            Mapping of path to VaultSecret for every path that was read
+        """
+        secrets: dict[str, VaultSecret] = {}
+        misses: list[str] = []
+        for path in dict.fromkeys(paths):
+            try:
+                cached = self._get_from_cache(path)
+            except VaultSecretNotFoundError as e:
+                logger.warning("Failed to read secret %s: %s", path, e)
+                continue
+            if cached is not None:
+                secrets[path] = cached
+            else:
+                misses.append(path)
+
+        if not misses:
+            return secrets
+
+        # Authenticate once up front rather than racing in every worker
+        self._ensure_authenticated()
+
+        pool = self._get_fetch_pool()
+        limit = min(len(misses), self.config.max_parallel)
+        if max_workers is None or max_workers >= limit:
+            futures = {path: pool.submit(self.get_secret, path) for path in misses}
+        else:
+            # Hold back submissions so at most max_workers reads run at once
+            slots = Semaphore(max(1, max_workers))
+            futures = {}
+            for path in misses:
+                slots.acquire()
+                future = pool.submit(self.get_secret, path)
+                future.add_done_callback(lambda _: slots.release())
+                futures[path] = future
+        for path, future in futures.items():
+            try:
+                secrets[path] = future.result()
+            except Exception as e:
+                logger.warning("Failed to read secret %s: %s", path, e)
+
+        return secrets
+
+    def _with_retry(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a Vault API function, retrying transient server errors.
+
+        Sealed or standby nodes, internal server errors and rate limiting are
+        retried up to ``config.retries`` times with exponential backoff.
+        Other errors, such as missing paths or denied access, are raised
+        immediately. Only use it for reads: a failed write may still have
+        been applied, and resending it would create another version.
+        """
+        for attempt in range(self.config.retries):
+            try:
+                return fn(*args, **kwargs)
+            except _RETRYABLE_ERRORS as e:
+                delay = min(0.1 * 2**attempt, 5)
+                logger.debug("Transient Vault error, retrying in %.1fs: %s", delay, e)
+                time.sleep(delay)
+        return fn(*args, **kwargs)
+
+    def _read_secret(
+        self,
+        path: str,
+        version: Optional[int],
+        use_cache: bool,
+    ) -> VaultSecret:
+        """Read a secret from Vault, bypassing the cache lookup.
+
+        Args:
+            path: Secret path
+            version: Optional specific version to retrieve
+            use_cache: Whether to cache the result
+
+        Returns:
+            VaultSecret with the secret data
+        """
         self._ensure_authenticated()
 
         try:
-            client = self._get_client()
+            client = self.client
 
             # Convert path format for KV v2
             # Input: "bike-data-flow/production/database"
             # Vault: "secret/data/bike-data-flow/production/database"
-            mount_point = "secret"
-
-            response = client.secrets.kv.v2.read_secret_version(
-                path=path,
+            response = self._with_retry(
+                client.secrets.kv.v2.read_secret_version,
+                path=self._normalize_kv_path(path),
                 version=version,
-                mount_point=mount_point,
+                mount_point=self._mount_point,
             )
 
             data = response.get("data", {}).get("data", {})
@@ -324,13 +1128,19 @@ class VaultClient:
                 version=metadata.get("version"),
             )
 
-            # Cache the result
-            if use_cache:
+            # Cache the result; the cache only holds the latest version
+            if use_cache and version is None:
                 self._set_cache(secret)
 
             return secret
 
         except InvalidPath as e:
+            # Cache entries are keyed by the normalized path alone, so they
+            # are dropped by write_secret, delete_secret and rotate_secret
+            # under any alias. A missing version says nothing about whether
+            # the latest one exists, so it is not cached
+            if use_cache and version is None:
+                self._set_negative_cache(path)
             raise VaultSecretNotFoundError(
                 path=path,
                 message=f"Secret not found at path: {path}",
@@ -362,22 +1172,15 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            client = self._get_client()
+            client = self.client
 
-            mount_point = "secret"
-
-            # Strip "secret/data/" prefix if present
-            if path.startswith("secret/data/"):
-                full_path = path.replace("secret/data/", "", 1)
-            elif path.startswith("secret/"):
-                full_path = path.replace("secret/", "", 1)
-            else:
-                full_path = path
+            full_path = self._normalize_kv_path(path)
 
+            # Not retried: Vault may have applied the write before failing
             client.secrets.kv.v2.create_or_update_secret(
                 path=full_path,
                 secret=data,
-                mount_point=mount_point,
+                mount_point=self._mount_point,
                 options=options,
             )
 
@@ -390,6 +1193,10 @@ class VaultClient:
                 version=None,  # Will be retrieved on read
             )
 
+        except VaultDown as e:
+            raise VaultConnectionError(
+                f"Vault server is unreachable: {e}"
+            ) from e
         except Exception as e:
             raise VaultError(f"Failed to write secret: {e}") from e
 
@@ -410,34 +1217,32 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            client = self._get_client()
+            client = self.client
 
-            mount_point = "secret"
-
-            if path.startswith("secret/data/"):
-                full_path = path.replace("secret/data/", "", 1)
-            elif path.startswith("secret/"):
-                full_path = path.replace("secret/", "", 1)
-            else:
-                full_path = path
+            full_path = self._normalize_kv_path(path)
 
             if versions:
-                # Delete specific versions
+                # Delete specific versions. Like writes, deletes are not
+                # retried, since Vault may have applied them before failing.
                 client.secrets.kv.v2.delete_versions(
                     path=full_path,
                     versions=versions,
-                    mount_point=mount_point,
+                    mount_point=self._mount_point,
                 )
             else:
                 # Delete all versions and the secret
                 client.secrets.kv.v2.delete_metadata_and_all_versions(
                     path=full_path,
-                    mount_point=mount_point,
+                    mount_point=self._mount_point,
                 )
 
             # Invalidate cache
             self._clear_cache(path)
 
+        except VaultDown as e:
+            raise VaultConnectionError(
+                f"Vault server is unreachable: {e}"
+            ) from e
         except Exception as e:
             raise VaultError(f"Failed to delete secret: {e}") from e
 
@@ -456,23 +1261,18 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            client = self._get_client()
-
-            mount_point = "secret"
+            client = self.client
 
             # Ensure path ends with /
             if not path.endswith("/"):
                 path = path + "/"
 
-            # Strip "secret/data/" prefix if present
-            if path.startswith("secret/data/"):
-                full_path = path.replace("secret/data/", "", 1)
-            else:
-                full_path = path
+            full_path = self._normalize_kv_path(path)
 
-            response = client.secrets.kv.v2.list_secrets(
+            response = self._with_retry(
+                client.secrets.kv.v2.list_secrets,
                 path=full_path,
-                mount_point=mount_point,
+                mount_point=self._mount_point,
             )
 
             keys = response.get("data", {}).get("keys", [])
@@ -480,9 +1280,44 @@ class VaultClient:
 
         except InvalidPath:
             return []
+        except VaultDown as e:
+            raise VaultConnectionError(
+                f"Vault server is unreachable: {e}"
+            ) from e
         except Exception as e:
             raise VaultError(f"Failed to list secrets: {e}") from e
 
+    def iter_secrets(self, path: str) -> Iterator[str]:
+        """Iterate over every secret below a path, descending into subfolders.
+
+        Folders are listed one at a time as iteration proceeds, so memory use
+        is bounded by a single listing and the first paths are available
+        after one round trip.
+
+        Args:
+            path: Parent path to walk (e.g., "bike-data-flow/production/")
+
+        Yields:
+            Full paths of the secrets found
+
+        Raises:
+            VaultError: If a list fails
+        """
+        if not path.endswith("/"):
+            path = path + "/"
+
+        pending = [path]
+        while pending:
+            folder = pending.pop()
+            subfolders = []
+            for key in self.list_secrets(folder):
+                if key.endswith("/"):
+                    subfolders.append(folder + key)
+                else:
+                    yield folder + key
+            # Push in reverse so folders are walked in listing order
+            pending.extend(reversed(subfolders))
+
     def get_secret_metadata(self, path: str) -> SecretMetadata:
         """Get metadata for a secret.
 
@@ -498,20 +1333,14 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            client = self._get_client()
+            client = self.client
 
-            mount_point = "secret"
+            full_path = self._normalize_kv_path(path)
 
-            if path.startswith("secret/data/"):
-                full_path = path.replace("secret/data/", "", 1)
-            elif path.startswith("secret/"):
-                full_path = path.replace("secret/", "", 1)
-            else:
-                full_path = path
-
-            response = client.secrets.kv.v2.read_secret_metadata(
+            response = self._with_retry(
+                client.secrets.kv.v2.read_secret_metadata,
                 path=full_path,
-                mount_point=mount_point,
+                mount_point=self._mount_point,
             )
 
             metadata = response.get("data", {})
@@ -519,10 +1348,8 @@ class VaultClient:
             # Parse creation time
             created_time_str = metadata.get("created_time", "")
             try:
-                created_time = datetime.fromisoformat(
-                    created_time_str.replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
+                created_time = _parse_timestamp(created_time_str)
+            except (ValueError, TypeError, AttributeError):
                 created_time = datetime.utcnow()
 
             return SecretMetadata(
@@ -546,19 +1373,55 @@ class VaultClient:
             path: Specific path to invalidate, or None for all
         """
         self._clear_cache(path)
-        logger.info(f"Cache invalidated for: {path or 'all'}")
+        logger.info("Cache invalidated for: %s", path or "all")
 
-    def close(self) -> None:
-        """Close the Vault client and cleanup resources."""
-        if self._client is not None:
-            # Revoke the token if we have one
-            try:
-                self._client.auth.token.self_revoke()
-            except Exception:
-                pass  # Ignore revocation errors
-            self._client = None
-        self._initialized = False
-        self._cache.clear()
+    def close(self, revoke: bool = False) -> None:
+        """Close the Vault client and cleanup resources.
+
+        The token is left to expire on its own TTL unless revocation is
+        requested, so closing never blocks on a round trip by default. A
+        token still used by another open client, such as a shared AppRole
+        login, is never revoked.
+
+        Args:
+            revoke: Revoke the client's token before closing, unless other
+                clients still use it
+        """
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        if self._renew_timer is not None:
+            self._renew_timer.cancel()
+        with self._auth_lock:
+            # Clear readiness first so no caller skips the lock and finds the
+            # client gone
+            self._ready.clear()
+            self._renew_timer = None
+            other_holders = self._release_token()
+            if revoke and other_holders:
+                logger.info(
+                    "Not revoking Vault token still used by %d other client(s)",
+                    other_holders,
+                )
+                revoke = False
+            if self._client is not None:
+                if revoke:
+                    # Other clients must not pick up a revoked shared token
+                    self._drop_shared_token()
+                    try:
+                        self._client.auth.token.self_revoke()
+                    except Exception:
+                        pass  # Ignore revocation errors
+                self._client = None
+            self._lease = None
+            # Released under the lock the client property creates it under
+            if self._session is not None:
+                _release_session(self._session_key)
+                self._session = None
+        if self._fetch_pool is not None:
+            self._fetch_pool.shutdown(wait=False)
+            self._fetch_pool = None
+        self._shards = [_CacheShard(self._shard_capacity) for _ in range(_CACHE_SHARDS)]
         logger.info("Vault client closed")
 
     def __enter__(self) -> "VaultClient":
@@ -569,13 +1432,6 @@ class VaultClient:
         """Context manager exit."""
         self.close()
 
-    def __del__(self) -> None:
-        """Destructor to cleanup."""
-        try:
-            self.close()
-        except Exception:
-            pass
-
     # =========================================================================
     # Secret Rotation Methods
     # =========================================================================
@@ -594,8 +1450,6 @@ class VaultClient:
         Raises:
             VaultError: If configuration fails
         """
-        from wrm_pipeline.wrm_pipeline.vault.rotation import RotationScheduler, RotationHistoryTracker
-
         self._ensure_authenticated()
 
         # Initialize rotation components if not present
@@ -616,16 +1470,17 @@ class VaultClient:
         try:
             self._client.secrets.kv.v2.create_or_update_secret(
                 path=policy_path,
-                secret=policy.model_dump(),
-                mount_point="secret",
+                secret=policy.model_dump(mode="json"),
+                mount_point=self._mount_point,
             )
         except Exception as e:
-            logger.warning(f"Could not store rotation policy in Vault: {e}")
+            logger.warning("Could not store rotation policy in Vault: %s", e)
 
         # Schedule the rotation
         self._rotation_scheduler.schedule_rotation(policy)
+        self._rotation_secrets_cache = None
 
-        logger.info(f"Configured rotation policy for {policy.secret_path}")
+        logger.info("Configured rotation policy for %s", policy.secret_path)
         return policy
 
     def rotate_secret(
@@ -648,12 +1503,6 @@ class VaultClient:
             VaultSecretNotFoundError: If secret doesn't exist
             VaultError: If rotation fails
         """
-        from wrm_pipeline.wrm_pipeline.vault.rotation import (
-            RotationOrchestrator,
-            RotationScheduler,
-            RotationHistoryTracker,
-        )
-
         self._ensure_authenticated()
 
         # Check secret exists
@@ -683,7 +1532,7 @@ class VaultClient:
             try:
                 stored_policy = self._client.secrets.kv.v2.read_secret_version(
                     path=policy_path,
-                    mount_point="secret",
+                    mount_point=self._mount_point,
                 )
                 policy_data = stored_policy.get("data", {}).get("data", {})
                 if "last_rotated" in policy_data:
@@ -692,7 +1541,7 @@ class VaultClient:
                     self._client.secrets.kv.v2.create_or_update_secret(
                         path=policy_path,
                         secret=policy_data,
-                        mount_point="secret",
+                        mount_point=self._mount_point,
                     )
             except Exception:
                 pass  # Policy may not exist
@@ -700,7 +1549,7 @@ class VaultClient:
         # Invalidate cache
         self._clear_cache(secret_path)
 
-        logger.info(f"Rotated secret: {secret_path}")
+        logger.info("Rotated secret: %s", secret_path)
         return history
 
     def get_rotation_status(self, secret_path: str) -> dict[str, Any]:
@@ -712,8 +1561,6 @@ class VaultClient:
         Returns:
             Dictionary with rotation status information
         """
-        from wrm_pipeline.wrm_pipeline.vault.rotation import RotationScheduler, RotationHistoryTracker
-
         self._ensure_authenticated()
 
         # Check if we have a scheduler with this secret
@@ -727,7 +1574,7 @@ class VaultClient:
         try:
             stored_policy = self._client.secrets.kv.v2.read_secret_version(
                 path=policy_path,
-                mount_point="secret",
+                mount_point=self._mount_point,
             )
             policy_data = stored_policy.get("data", {}).get("data", {})
             return {
@@ -747,35 +1594,46 @@ class VaultClient:
     def list_secrets_for_rotation(self) -> list[str]:
         """List all secrets with rotation policies.
 
+        Results are cached for a short time; configuring a rotation policy
+        through this client invalidates the cache.
+
         Returns:
             List of secret paths with rotation configured
         """
+        cached = self._rotation_secrets_cache
+        if cached is not None and time.monotonic() - cached[0] < _ROTATION_LIST_TTL:
+            return list(cached[1])
+
         self._ensure_authenticated()
 
         secrets: list[str] = []
+        seen: set[str] = set()
 
         # Check scheduler
         if hasattr(self, "_rotation_scheduler"):
             for policy in self._rotation_scheduler.get_scheduled_secrets():
-                secrets.append(policy.secret_path)
+                if policy.secret_path not in seen:
+                    seen.add(policy.secret_path)
+                    secrets.append(policy.secret_path)
 
         # Check Vault for stored policies
         try:
             policies = self._client.secrets.kv.v2.list_secrets(
                 path="_rotation_policies",
-                mount_point="secret",
+                mount_point=self._mount_point,
             )
             keys = policies.get("data", {}).get("keys", [])
             for key in keys:
                 if key.endswith("/"):
                     continue
-                secret_path = key
-                if secret_path not in secrets:
-                    secrets.append(secret_path)
+                if key not in seen:
+                    seen.add(key)
+                    secrets.append(key)
         except Exception:
             pass  # No policies stored
 
-        return secrets
+        self._rotation_secrets_cache = (time.monotonic(), secrets)
+        return list(secrets)
 
     def get_rotation_history(
         self,
@@ -793,8 +1651,6 @@ class VaultClient:
         Returns:
             List of rotation history entries
         """
-        from wrm_pipeline.wrm_pipeline.vault.rotation import RotationScheduler, RotationHistoryTracker
-
         self._ensure_authenticated()
 
         # Get history from scheduler if available
@@ -817,8 +1673,6 @@ class VaultClient:
         Returns:
             Dictionary with rotation statistics
         """
-        from wrm_pipeline.wrm_pipeline.vault.rotation import RotationScheduler, RotationHistoryTracker
-
         self._ensure_authenticated()
 
         if hasattr(self, "_rotation_scheduler"):
@@ -842,8 +1696,6 @@ class VaultClient:
         Returns:
             List of rotation history records
         """
-        from wrm_pipeline.wrm_pipeline.vault.rotation import RotationScheduler, RotationHistoryTracker
-
         self._ensure_authenticated()
 
         if not hasattr(self, "_rotation_scheduler"):
@@ -894,12 +1746,12 @@ class VaultClient:
             hcl_content = manager.to_hcl(policy)
 
             # Apply to Vault
-            self._get_client().sys.create_or_update_policy(
+            self.client.sys.create_or_update_policy(
                 name=policy.name,
                 policy=hcl_content,
             )
 
-            logger.info(f"Created policy in Vault: {policy.name}")
+            logger.info("Created policy in Vault: %s", policy.name)
             return policy
 
         except PolicyValidationError as e:
@@ -925,17 +1777,19 @@ class VaultClient:
         manager = self._get_policy_manager()
 
         try:
-            # Parse HCL to AccessPolicy
-            policy = manager.parse_hcl(hcl_content)
-            policy.name = name  # Ensure name matches
+            # Parse HCL to AccessPolicy, ensuring the name matches
+            parsed = manager.parse_hcl(hcl_content)
+            policy = AccessPolicy(
+                name=name, rules=parsed.rules, description=parsed.description
+            )
 
             # Apply to Vault
-            self._get_client().sys.create_or_update_policy(
+            self.client.sys.create_or_update_policy(
                 name=name,
                 policy=hcl_content,
             )
 
-            logger.info(f"Created policy from HCL: {name}")
+            logger.info("Created policy from HCL: %s", name)
             return policy
 
         except Exception as e:
@@ -950,10 +1804,10 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            response = self._get_client().sys.list_policies()
+            response = self.client.sys.list_policies()
             return response.get("policies", [])
         except Exception as e:
-            logger.error(f"Failed to list policies: {e}")
+            logger.error("Failed to list policies: %s", e)
             return []
 
     def get_policy(self, name: str) -> Optional[str]:
@@ -968,7 +1822,7 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            response = self._get_client().sys.read_policy(name=name)
+            response = self.client.sys.read_policy(name=name)
             return response.get("rules", "")
         except Exception:
             return None
@@ -1001,11 +1855,11 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            self._get_client().sys.delete_policy(name=name)
-            logger.info(f"Deleted policy from Vault: {name}")
+            self.client.sys.delete_policy(name=name)
+            logger.info("Deleted policy from Vault: %s", name)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete policy '{name}' from Vault: {e}")
+            logger.error("Failed to delete policy '%s' from Vault: %s", name, e)
             return False
 
     def apply_policy_hcl(self, name: str, hcl_path: str) -> AccessPolicy:
@@ -1055,12 +1909,12 @@ class VaultClient:
                 if Path(hcl_path).exists():
                     self.apply_policy_hcl(policy_name, hcl_path)
                     results[policy_name] = True
-                    logger.info(f"Synced built-in policy: {policy_name}")
+                    logger.info("Synced built-in policy: %s", policy_name)
                 else:
-                    logger.warning(f"Policy file not found: {hcl_path}")
+                    logger.warning("Policy file not found: %s", hcl_path)
                     results[policy_name] = False
             except Exception as e:
-                logger.error(f"Failed to sync policy '{policy_name}': {e}")
+                logger.error("Failed to sync policy '%s': %s", policy_name, e)
                 results[policy_name] = False
 
         return results
@@ -1077,7 +1931,7 @@ class VaultClient:
         self._ensure_authenticated()
 
         try:
-            self._get_client().sys.read_policy(name=name)
+            self.client.sys.read_policy(name=name)
             return True
         except Exception:
             return False
@@ -1095,22 +1949,82 @@ class VaultClient:
         return manager.to_hcl(policy)
 
 
-@lru_cache(maxsize=32)
-def get_cached_client(config_tuple: tuple) -> VaultClient:
+# Shared clients keyed by their full connection configuration (see
+# _client_key). The registry holds them for the life of the process, so a
+# client keeps its token and cache between transient callers; their
+# connections are released at interpreter exit. Each key has its own build
+# lock so clients for different servers can be created concurrently.
+_clients: dict[tuple, VaultClient] = {}
+_clients_lock = Lock()
+_client_build_locks: defaultdict[tuple, Lock] = defaultdict(Lock)
+
+
+def get_cached_client(
+    config: Union[VaultConnectionConfig, tuple],
+) -> VaultClient:
     """Get a cached Vault client instance.
 
-    This is a convenience function for creating clients that can be
-    cached by their configuration.
+    Clients are shared only between identical configurations, credentials
+    included, so a caller is never handed a client authenticated as someone
+    else. Those callers share one client, its secret cache and its
+    connection pool. The registry keeps each client for the life of the
+    process and releases it at exit, so callers need not close it.
 
     Args:
-        config_tuple: Serialized configuration tuple
+        config: Connection configuration. A serialized configuration tuple
+            is still accepted but deprecated.
 
     Returns:
         VaultClient instance
     """
-    # Note: This is a simple implementation. For production, consider
-    # using a proper caching mechanism with expiration.
-    config = VaultConnectionConfig(
+    if isinstance(config, tuple):
+        warnings.warn(
+            "Passing a configuration tuple to get_cached_client is deprecated; "
+            "pass a VaultConnectionConfig instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        config = _config_from_tuple(config)
+
+    key = _client_key(config)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        build_lock = _client_build_locks[key]
+
+    with build_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = VaultClient(config)
+            client._registry_owned = True
+            with _clients_lock:
+                _clients[key] = client
+                _client_build_locks.pop(key, None)
+    return client
+
+
+# Configuration fields identifying who a client authenticates as
+_CREDENTIAL_FIELDS = ("role_id", "secret_id", "token")
+
+
+def _client_key(config: VaultConnectionConfig) -> tuple:
+    """Registry key covering every field of a connection configuration.
+
+    Credentials are folded into a digest so the registry never holds them in
+    clear; every other field is kept as is, since it changes how the client
+    behaves.
+    """
+    fields = config.model_dump()
+    credentials = json.dumps([fields.pop(name) for name in _CREDENTIAL_FIELDS])
+    digest = hashlib.blake2b(credentials.encode(), digest_size=16).hexdigest()
+    return (digest, *sorted(fields.items()))
+
+
+def _config_from_tuple(config_tuple: tuple) -> VaultConnectionConfig:
+    """Build a configuration from a serialized configuration tuple."""
+    return VaultConnectionConfig(
         vault_addr=config_tuple[0],
         auth_method=config_tuple[1],
         role_id=config_tuple[2] if len(config_tuple) > 2 else None,
@@ -1121,4 +2035,3 @@ def get_cached_client(config_tuple: tuple) -> VaultClient:
         retries=config_tuple[7] if len(config_tuple) > 7 else 3,
         cache_ttl=config_tuple[8] if len(config_tuple) > 8 else 300,
     )
-    return VaultClient(config)
@@ -4,14 +4,79 @@ This module defines all data models used by the Vault client, including
 secrets, configuration, policies, and audit logging.
 """
 
-from datetime import datetime
+from __future__ import annotations
+
+import copy
+import json
+import re
+import sys
+from collections.abc import Mapping
+from functools import cached_property
+
+# Kept as a runtime import: pydantic resolves the postponed annotations
+# against this module's globals when the schemas are built
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Optional
-
-from pydantic import BaseModel, Field, field_validator
-
-
-class VaultHealthStatus(str, Enum):
+from types import MappingProxyType
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+
+    class StrEnum(str, Enum):
+        """Fallback for enum.StrEnum on Python < 3.11."""
+
+        def __str__(self) -> str:
+            return self.value
+
+# Compiled once for SecretRotationPolicy.validate_emails
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+# Model configs shared across the module, so every model reuses the same
+# settings instead of building its own. Schema examples live in MODEL_EXAMPLES.
+# Validators and serializers are built on a model's first use rather than at
+# import, so importing the vault package stays cheap.
+_BASE_CONFIG = ConfigDict(
+    frozen=True, extra="forbid", populate_by_name=True, defer_build=True
+)
+# Records keep enum fields as their plain string values
+_RECORD_CONFIG = ConfigDict(**_BASE_CONFIG, use_enum_values=True)
+# Models updated in place by the rotation scheduler
+_MUTABLE_CONFIG = ConfigDict(extra="forbid", populate_by_name=True, defer_build=True)
+
+# Checked by pydantic-core itself rather than by Python field validators
+SecretPath = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, pattern=r"^\S+$")
+]
+VaultAddr = Annotated[
+    str,
+    StringConstraints(pattern=r"^https?://"),
+    AfterValidator(lambda v: v.rstrip("/")),
+]
+# Policy paths: plain segments plus the *, + and {a,b} globs Vault accepts
+PolicyPath = Annotated[
+    str, StringConstraints(min_length=1, pattern=r"^[a-zA-Z0-9_\-/*.+{},]+$")
+]
+# Audit fields that repeat across entries share one string object per value
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+class VaultHealthStatus(StrEnum):
     """Vault health status values."""
 
     INITIALIZED = "initialized"
@@ -22,7 +87,14 @@ class VaultHealthStatus(str, Enum):
     DISABLED = "disabled"
 
 
-class RotationType(str, Enum):
+# Value-to-member lookups for parsers that bypass pydantic; a plain dict get
+# instead of going through the enum's __call__
+VAULT_HEALTH_STATUS_BY_VALUE: Mapping[str, VaultHealthStatus] = MappingProxyType(
+    {member.value: member for member in VaultHealthStatus}
+)
+
+
+class RotationType(StrEnum):
     """Types of secret rotation."""
 
     MANUAL = "manual"
@@ -31,7 +103,12 @@ class RotationType(str, Enum):
     DYNAMIC = "dynamic"
 
 
-class AuditOperation(str, Enum):
+ROTATION_TYPE_BY_VALUE: Mapping[str, RotationType] = MappingProxyType(
+    {member.value: member for member in RotationType}
+)
+
+
+class AuditOperation(StrEnum):
     """Types of audit operations."""
 
     READ = "read"
@@ -42,21 +119,42 @@ class AuditOperation(str, Enum):
     DENY = "deny"
 
 
-class Secret(BaseModel):
+AUDIT_OPERATION_BY_VALUE: Mapping[str, AuditOperation] = MappingProxyType(
+    {member.value: member for member in AuditOperation}
+)
+
+
+class _JSONRecord(BaseModel):
+    """Base for models emitted in bulk, adding a direct JSON bytes dump."""
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes.
+
+        Prefer this over ``json.dumps(model.model_dump())``: the record goes
+        through the compiled serializer once, with no intermediate dict.
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
+
+class Secret(_JSONRecord):
     """Represents a secret stored in Vault.
 
-    This model corresponds to the KV v2 secrets engine response format.
+    This model corresponds to the KV v2 secrets engine response format. The
+    secret data is kept as the raw JSON from Vault and only decoded when
+    :attr:`data` is first read, so secrets that are passed straight through
+    are never walked key by key.
     """
 
-    path: str = Field(
+    path: SecretPath = Field(
         ...,
         description="Full path to the secret in Vault KV v2",
-        examples=["secret/data/bike-data-flow/production/database"],
     )
-    data: dict[str, Any] = Field(
+    data_raw: bytes = Field(
         ...,
-        description="Secret data key-value pairs",
-        examples=[{"username": "db_user", "host": "db.example.com"}],
+        description="Secret data key-value pairs as a raw JSON object",
     )
     version: int = Field(
         default=1,
@@ -67,45 +165,66 @@ class Secret(BaseModel):
         ...,
         description="Creation timestamp",
     )
-    custom_metadata: Optional[dict[str, Any]] = Field(
-        default=None,
+    custom_metadata: dict[str, Any] = Field(
+        default_factory=dict,
         description="Custom metadata",
     )
 
-    @field_validator("path")
+    model_config = _BASE_CONFIG
+
+    @model_validator(mode="before")
     @classmethod
-    def validate_path(cls, v: str) -> str:
-        """Validate Vault path format."""
-        if not v or not v.strip():
-            raise ValueError("Path cannot be empty")
-        # Vault paths should not contain spaces or special chars except /_-.
-        if " " in v:
-            raise ValueError("Path cannot contain spaces")
-        return v.strip()
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "path": "secret/data/bike-data-flow/production/database",
-                "data": {
-                    "username": "db_user",
-                    "host": "db.example.com",
-                },
-                "version": 3,
-                "created_time": "2026-01-10T10:00:00Z",
-            }
-        }
+    def encode_data(cls, values: Any) -> Any:
+        """Accept decoded secret data under ``data``, as the model serializes it.
+
+        The mapping is JSON-encoded into ``data_raw``, so a dumped secret
+        validates back and callers may keep passing ``data=...``.
+        """
+        if isinstance(values, dict) and "data" in values:
+            values = dict(values)
+            data = values.pop("data")
+            if isinstance(data, Mapping):
+                data = json.dumps(dict(data))
+            values.setdefault("data_raw", data)
+        return values
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        """Secret data key-value pairs, decoded on first access."""
+        return json.loads(self.data_raw)
+
+    @model_serializer(mode="wrap")
+    def serialize_data(self, handler: Any) -> dict[str, Any]:
+        """Serialize the decoded secret data in place of the raw JSON."""
+        out = handler(self)
+        if out.pop("data_raw", None) is not None:
+            out["data"] = self.data
+        return out
+
+
+# Validates lists of secrets in one pass; built once at import
+SECRET_LIST_ADAPTER: TypeAdapter[list[Secret]] = TypeAdapter(list[Secret])
+
+
+def _freeze(data: dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a dict in a read-only view."""
+    return MappingProxyType(data)
 
 
 class VaultSecret(BaseModel):
-    """Simplified secret model for external use."""
+    """Simplified secret model for external use.
+
+    ``data`` is a read-only mapping. Cached secrets are shared by every
+    caller reading the same path, so one caller can't corrupt another's view
+    and no defensive copy is needed on a cache hit.
+    """
 
     path: str = Field(
         ...,
         description="Secret path",
         examples=["bike-data-flow/production/database"],
     )
-    data: dict[str, Any] = Field(
+    data: Mapping[str, Any] = Field(
         ...,
         description="Secret data",
     )
@@ -114,14 +233,39 @@ class VaultSecret(BaseModel):
         description="Secret version if available",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "path": "bike-data-flow/production/database",
-                "data": {"username": "db_user", "password": "secret123"},
-                "version": 2,
-            }
-        }
+    @field_validator("data")
+    @classmethod
+    def freeze_data(cls, v: dict[str, Any]) -> Mapping[str, Any]:
+        """Store secret data as a read-only view."""
+        return _freeze(v)
+
+    @field_serializer("data")
+    def serialize_data(self, v: Mapping[str, Any]) -> dict[str, Any]:
+        """Serialize secret data as a plain dict."""
+        return dict(v)
+
+    # mappingproxy can't be pickled or deep-copied, so the data travels as a
+    # plain dict and is frozen again on the way back in
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Get the pickled state, with the data as a plain dict."""
+        state = super().__getstate__()
+        state["__dict__"] = {**state["__dict__"], "data": dict(self.data)}
+        return state
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Restore a pickled state, freezing the data again."""
+        fields = state["__dict__"]
+        state = {**state, "__dict__": {**fields, "data": _freeze(fields["data"])}}
+        super().__setstate__(state)
+
+    def __deepcopy__(self, memo: Optional[dict[int, Any]] = None) -> VaultSecret:
+        """Deep-copy the secret through its pickled state."""
+        copied = self.__class__.__new__(self.__class__)
+        copied.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return copied
+
+    model_config = _BASE_CONFIG
 
 
 class SecretMetadata(BaseModel):
@@ -136,26 +280,21 @@ class SecretMetadata(BaseModel):
     destroyed: bool = Field(default=False, description="Whether secret is destroyed")
     version: int = Field(default=1, description="Current version")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "secret_path": "secret/data/bike-data-flow/production/database",
-                "created_time": "2026-01-10T10:00:00Z",
-                "destroyed": False,
-                "version": 3,
-            }
-        }
+    model_config = _BASE_CONFIG
 
 
 class PolicyRule(BaseModel):
     """Single policy rule defining access to a path."""
 
-    path: str = Field(
+    path: PolicyPath = Field(
         ...,
         description="Secret path pattern (supports wildcards)",
         examples=["secret/data/bike-data-flow/production/*"],
     )
-    capabilities: list[str] = Field(
+    # A tuple, so rules shared between policies can't be changed through one
+    capabilities: tuple[
+        Literal["create", "read", "update", "delete", "list", "patch", "sudo"], ...
+    ] = Field(
         ...,
         description=(
             "Allowed capabilities: create, read, update, delete, list, patch, sudo"
@@ -167,28 +306,22 @@ class PolicyRule(BaseModel):
         description="Human-readable description",
     )
 
-    @field_validator("capabilities")
-    @classmethod
-    def validate_capabilities(cls, v: list[str]) -> list[str]:
-        """Validate capability values."""
-        valid = {"create", "read", "update", "delete", "list", "patch", "sudo"}
-        for cap in v:
-            if cap not in valid:
-                raise ValueError(f"Invalid capability: {cap}. Must be one of {valid}")
-        return v
+    model_config = _BASE_CONFIG
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "path": "secret/data/bike-data-flow/production/*",
-                "capabilities": ["read"],
-                "description": "Read access to all production secrets",
-            }
-        }
+
+# Hashable snapshot of a policy: (name, description, ((path, caps, description), ...))
+PolicyKey = tuple[
+    str, Optional[str], tuple[tuple[str, tuple[str, ...], Optional[str]], ...]
+]
 
 
 class AccessPolicy(BaseModel):
-    """Defines access control policy for Vault secrets."""
+    """Defines access control policy for Vault secrets.
+
+    Policies are immutable down to each rule's capabilities, so
+    :attr:`structural_key` is computed once and stays accurate for every
+    cache keyed on policy contents.
+    """
 
     name: str = Field(
         ...,
@@ -196,8 +329,8 @@ class AccessPolicy(BaseModel):
         examples=["dagster-secrets"],
         pattern=r"^[a-zA-Z0-9_-]+$",
     )
-    rules: list[PolicyRule] = Field(
-        default_factory=list,
+    rules: tuple[PolicyRule, ...] = Field(
+        default_factory=tuple,
         description="Policy rules",
     )
     description: Optional[str] = Field(
@@ -205,20 +338,16 @@ class AccessPolicy(BaseModel):
         description="Policy description",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "dagster-secrets",
-                "rules": [
-                    {
-                        "path": "secret/data/bike-data-flow/production/*",
-                        "capabilities": ["read"],
-                        "description": "Read access to production secrets",
-                    }
-                ],
-                "description": "Dagster pipeline access to secrets",
-            }
-        }
+    model_config = _BASE_CONFIG
+
+    @cached_property
+    def structural_key(self) -> PolicyKey:
+        """Hashable snapshot of everything that affects validation and HCL."""
+        return (
+            self.name,
+            self.description,
+            tuple((r.path, r.capabilities, r.description) for r in self.rules),
+        )
 
 
 class ListenerConfig(BaseModel):
@@ -236,14 +365,7 @@ class ListenerConfig(BaseModel):
         examples=["0.0.0.0:8201"],
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "type": "tcp",
-                "address": "0.0.0.0:8200",
-                "cluster_address": "0.0.0.0:8201",
-            }
-        }
+    model_config = _BASE_CONFIG
 
 
 class TLSConfig(BaseModel):
@@ -270,15 +392,7 @@ class TLSConfig(BaseModel):
         description="Custom cipher suites (optional)",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "enabled": True,
-                "cert_file": "/etc/vault.d/tls/vault.crt",
-                "key_file": "/etc/vault.d/tls/vault.key",
-                "min_version": "tls12",
-            }
-        }
+    model_config = _BASE_CONFIG
 
 
 class SealConfig(BaseModel):
@@ -291,13 +405,7 @@ class SealConfig(BaseModel):
     )
     disabled: bool = Field(default=False, description="Disable seal (not recommended)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "type": "shamir",
-                "disabled": False,
-            }
-        }
+    model_config = _BASE_CONFIG
 
 
 class TelemetryConfig(BaseModel):
@@ -313,13 +421,7 @@ class TelemetryConfig(BaseModel):
         description="Disable hostname prefix",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "statsite_address": "10.0.0.1:8125",
-                "disable_hostname": False,
-            }
-        }
+    model_config = _BASE_CONFIG
 
 
 class VaultConfig(BaseModel):
@@ -350,36 +452,18 @@ class VaultConfig(BaseModel):
         description="Disable mlock (required for containers)",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "storage_backend": "raft",
-                "listener": {
-                    "type": "tcp",
-                    "address": "0.0.0.0:8200",
-                    "cluster_address": "0.0.0.0:8201",
-                },
-                "tls": {
-                    "enabled": True,
-                    "cert_file": "/etc/vault.d/tls/vault.crt",
-                    "key_file": "/etc/vault.d/tls/vault.key",
-                    "min_version": "tls12",
-                },
-                "cluster_name": "bike-data-flow-vault",
-                "disable_mlock": True,
-            }
-        }
+    model_config = _BASE_CONFIG
 
 
 class VaultConnectionConfig(BaseModel):
     """Configuration for Vault client connections."""
 
-    vault_addr: str = Field(
+    vault_addr: VaultAddr = Field(
         ...,
         description="Vault server address (https://...)",
         examples=["https://vault.example.com:8200"],
     )
-    auth_method: str = Field(
+    auth_method: Literal["approle", "token", "kubernetes", "userpass", "ldap"] = Field(
         default="approle",
         description="Authentication method",
         examples=["approle"],
@@ -400,12 +484,31 @@ class VaultConnectionConfig(BaseModel):
         default=None,
         description="Enterprise namespace",
     )
+    token_cache_file: Optional[str] = Field(
+        default=None,
+        description="File to persist AppRole tokens in across restarts (mode 0600)",
+        examples=["~/.cache/wrm_pipeline/vault_token.json"],
+    )
     timeout: int = Field(
         default=30,
         description="Request timeout in seconds",
         ge=1,
         le=300,
     )
+    connect_timeout: Optional[float] = Field(
+        default=None,
+        description="Connect timeout in seconds (defaults to timeout)",
+        gt=0,
+        le=300,
+        examples=[1.0],
+    )
+    read_timeout: Optional[float] = Field(
+        default=None,
+        description="Read timeout in seconds (defaults to timeout)",
+        gt=0,
+        le=300,
+        examples=[5.0],
+    )
     retries: int = Field(
         default=3,
         description="Number of retry attempts",
@@ -418,54 +521,90 @@ class VaultConnectionConfig(BaseModel):
         ge=0,
         le=3600,
     )
+    cache_max: int = Field(
+        default=1024,
+        description="Maximum number of cached secrets",
+        ge=1,
+    )
+    negative_cache_ttl: int = Field(
+        default=30,
+        description="Seconds to remember missing secret paths (0 disables)",
+        ge=0,
+        le=3600,
+    )
     verify: bool = Field(
         default=True,
         description="Verify TLS certificates",
     )
+    max_parallel: int = Field(
+        default=8,
+        description="Maximum concurrent secret reads for batch fetches",
+        ge=1,
+        le=64,
+    )
 
-    @field_validator("vault_addr")
-    @classmethod
-    def validate_vault_addr(cls, v: str) -> str:
-        """Validate Vault address format."""
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("vault_addr must start with http:// or https://")
-        return v.rstrip("/")
+    @model_validator(mode="after")
+    def check_credentials(self) -> "VaultConnectionConfig":
+        """Validate configuration has required auth credentials."""
+        if self.auth_method == "approle" and not self.role_id:
+            raise ValueError("AppRole authentication requires role_id")
+        if self.auth_method == "token" and not self.token:
+            raise ValueError("Token authentication requires token")
+        # Kubernetes uses the pod's service account
+        return self
 
-    @field_validator("auth_method")
-    @classmethod
-    def validate_auth_method(cls, v: str) -> str:
-        """Validate authentication method."""
-        valid = {"approle", "token", "kubernetes", "userpass", "ldap"}
-        if v not in valid:
-            raise ValueError(f"Invalid auth_method: {v}. Must be one of {valid}")
-        return v
+    model_config = _BASE_CONFIG
 
-    def validate(self) -> bool:
-        """Validate configuration has required auth credentials."""
-        if self.auth_method == "approle":
-            return bool(self.role_id)
-        elif self.auth_method == "token":
-            return bool(self.token)
-        elif self.auth_method == "kubernetes":
-            return True  # Uses service account
-        else:
-            return False
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "vault_addr": "https://vault.example.com:8200",
-                "auth_method": "approle",
-                "role_id": "my-role-id",
-                "secret_id": "my-secret-id",
-                "timeout": 30,
-                "retries": 3,
-                "cache_ttl": 300,
-            }
-        }
+
+class ApproleConnectionConfig(VaultConnectionConfig):
+    """Connection configuration for AppRole authentication."""
+
+    auth_method: Literal["approle"] = "approle"
+    role_id: str = Field(..., description="AppRole role ID")
+
+
+class TokenConnectionConfig(VaultConnectionConfig):
+    """Connection configuration for token authentication."""
+
+    auth_method: Literal["token"] = "token"
+    token: str = Field(..., description="Vault token")
+
+
+class KubernetesConnectionConfig(VaultConnectionConfig):
+    """Connection configuration for Kubernetes service account authentication."""
+
+    auth_method: Literal["kubernetes"] = "kubernetes"
+
+
+# Validation picks the branch from auth_method instead of trying each in turn
+ConnectionConfig = Annotated[
+    Union[ApproleConnectionConfig, TokenConnectionConfig, KubernetesConnectionConfig],
+    Field(discriminator="auth_method"),
+]
+CONNECTION_CONFIG_ADAPTER: TypeAdapter[ConnectionConfig] = TypeAdapter(
+    ConnectionConfig
+)
+
+
+def parse_connection_config(data: Mapping[str, Any]) -> VaultConnectionConfig:
+    """Build the connection config for the auth method named in ``data``.
+
+    Args:
+        data: Connection settings; ``auth_method`` defaults to ``"approle"``
+
+    Returns:
+        ApproleConnectionConfig, TokenConnectionConfig or
+        KubernetesConnectionConfig
+
+    Raises:
+        pydantic.ValidationError: If the settings are invalid for the method
+    """
+    if "auth_method" not in data:
+        data = {**data, "auth_method": "approle"}
+    return CONNECTION_CONFIG_ADAPTER.validate_python(data)
 
 
-class RotationStatus(str, Enum):
+class RotationStatus(StrEnum):
     """Status of a rotation operation."""
 
     SUCCESS = "success"
@@ -475,18 +614,21 @@ class RotationStatus(str, Enum):
     ROLLED_BACK = "rolled_back"
 
 
-class RotationHistory(BaseModel):
+ROTATION_STATUS_BY_VALUE: Mapping[str, RotationStatus] = MappingProxyType(
+    {member.value: member for member in RotationStatus}
+)
+
+
+class RotationHistory(_JSONRecord):
     """Record of a secret rotation operation."""
 
     id: str = Field(
         ...,
         description="Unique rotation history ID",
-        examples=["rot-abc123"],
     )
     secret_path: str = Field(
         ...,
         description="Path to the secret that was rotated",
-        examples=["secret/data/bike-data-flow/production/database"],
     )
     rotation_type: RotationType = Field(..., description="Type of rotation performed")
     status: RotationStatus = Field(..., description="Rotation status")
@@ -494,7 +636,6 @@ class RotationHistory(BaseModel):
     performed_by: Optional[str] = Field(
         default=None,
         description="User or system that performed the rotation",
-        examples=["system-scheduler", "admin@bike-data-flow"],
     )
     error_message: Optional[str] = Field(
         default=None,
@@ -512,25 +653,18 @@ class RotationHistory(BaseModel):
         default=None,
         description="New secret version",
     )
-    metadata: Optional[dict[str, Any]] = Field(
-        default=None,
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
         description="Additional rotation metadata",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "rot-abc123",
-                "secret_path": "secret/data/bike-data-flow/production/database",
-                "rotation_type": "automatic",
-                "status": "success",
-                "timestamp": "2026-01-10T12:00:00Z",
-                "performed_by": "system-scheduler",
-                "duration_seconds": 2.5,
-                "previous_version": 5,
-                "new_version": 6,
-            }
-        }
+    model_config = _RECORD_CONFIG
+
+
+# Validates lists of rotation records in one pass; built once at import
+ROTATION_HISTORY_LIST_ADAPTER: TypeAdapter[list[RotationHistory]] = TypeAdapter(
+    list[RotationHistory]
+)
 
 
 class SecretRotationPolicy(BaseModel):
@@ -559,10 +693,6 @@ class SecretRotationPolicy(BaseModel):
         default=None,
         description="Last rotation timestamp",
     )
-    next_rotation: Optional[datetime] = Field(
-        default=None,
-        description="Next scheduled rotation",
-    )
     is_active: bool = Field(
         default=True,
         description="Whether rotation is active for this secret",
@@ -592,76 +722,96 @@ class SecretRotationPolicy(BaseModel):
         description="Rollback to previous version on failure",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "secret_path": "secret/data/bike-data-flow/production/api-key",
-                "rotation_type": "scheduled",
-                "rotation_period_days": 90,
-                "rotation_script_path": "/opt/vault/scripts/rotate-api-key.sh",
-                "last_rotated": "2025-10-12T10:00:00Z",
-                "next_rotation": "2026-01-10T10:00:00Z",
-                "is_active": True,
-                "cron_schedule": "0 2 * * 0",
-                "notify_on_failure": True,
-                "notify_emails": ["admin@bike-data-flow"],
-                "max_retries": 3,
-                "rollback_on_failure": True,
-            }
-        }
+    model_config = _MUTABLE_CONFIG
+
+    @computed_field
+    @property
+    def next_rotation(self) -> Optional[datetime]:
+        """Next rotation due from the last rotation and the rotation period.
+
+        None if the policy has never been rotated or has no period; cron
+        schedules are resolved by the rotation scheduler.
+        """
+        if self.last_rotated is None or not self.rotation_period_days:
+            return None
+        return self.last_rotated + timedelta(days=self.rotation_period_days)
+
+    @model_validator(mode="before")
+    @classmethod
+    def drop_next_rotation(cls, data: Any) -> Any:
+        """Ignore an incoming next_rotation, which is derived on every read.
+
+        Dumped policies (such as those stored by
+        VaultClient.configure_rotation_policy) include it, so they validate
+        back, and callers that still pass it are not rejected.
+        """
+        if isinstance(data, dict) and "next_rotation" in data:
+            data = {k: v for k, v in data.items() if k != "next_rotation"}
+        return data
 
     @field_validator("notify_emails")
     @classmethod
     def validate_emails(cls, v: list[str]) -> list[str]:
         """Validate email addresses."""
-        import re
-        email_pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
         for email in v:
-            if not re.match(email_pattern, email):
+            if not _EMAIL_RE.match(email):
                 raise ValueError(f"Invalid email address: {email}")
         return v
 
 
-class AuditLog(BaseModel):
+class AuditLog(_JSONRecord):
     """Audit log entry for Vault operations."""
 
     timestamp: datetime = Field(..., description="Operation timestamp")
-    accessor: str = Field(
+    accessor: InternedStr = Field(
         ...,
         description="Entity that performed the operation",
-        examples=["token-abcd1234"],
     )
     operation: AuditOperation = Field(..., description="Type of operation")
-    path: str = Field(
+    path: InternedStr = Field(
         ...,
         description="Secret path accessed",
-        examples=["secret/data/bike-data-flow/production/database"],
     )
     success: bool = Field(..., description="Whether operation succeeded")
     error: Optional[str] = Field(default=None, description="Error message if failed")
-    client_ip: Optional[str] = Field(
+    client_ip: Optional[InternedStr] = Field(
         default=None,
         description="Client IP address",
-        examples=["10.0.0.5"],
     )
     request_id: Optional[str] = Field(
         default=None,
         description="Vault request ID",
-        examples=["req-xyz789"],
-    )
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "timestamp": "2026-01-10T10:30:00Z",
-                "accessor": "token-abcd1234",
-                "operation": "read",
-                "path": "secret/data/bike-data-flow/production/database",
-                "success": True,
-                "client_ip": "10.0.0.5",
-                "request_id": "req-xyz789",
-            }
-        }
+    )
+
+    model_config = _RECORD_CONFIG
+
+
+# Validates whole batches of audit entries in one pass; built once at import
+AUDIT_LOG_ADAPTER: TypeAdapter[list[AuditLog]] = TypeAdapter(list[AuditLog])
+
+
+def parse_audit_batch(raw: Union[str, bytes]) -> list[AuditLog]:
+    """Parse a batch of audit log entries from JSON.
+
+    Accepts either a JSON array or newline-delimited JSON objects, as written
+    by Vault's file audit device. The batch is validated straight from the
+    raw JSON without building intermediate dicts.
+
+    Args:
+        raw: JSON array or JSON lines
+
+    Returns:
+        Parsed AuditLog entries
+
+    Raises:
+        pydantic.ValidationError: If any entry is invalid
+    """
+    if isinstance(raw, str):
+        raw = raw.encode()
+    raw = raw.strip()
+    if not raw.startswith(b"["):
+        raw = b"[" + b",".join(line for line in raw.splitlines() if line.strip()) + b"]"
+    return AUDIT_LOG_ADAPTER.validate_json(raw)
 
 
 class VaultHealth(BaseModel):
@@ -685,13 +835,144 @@ class VaultHealth(BaseModel):
     )
     server_time_utc: datetime = Field(..., description="Server time")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "unsealed",
-                "version": "1.15.0",
-                "cluster_id": "vault-cluster-1234",
-                "cluster_name": "bike-data-flow-vault",
-                "server_time_utc": "2026-01-10T10:30:00Z",
+    model_config = _RECORD_CONFIG
+
+
+# Schema examples for every model, kept out of their field definitions and
+# configs so the runtime schema and validators stay lean. Only merged in when
+# documentation is generated.
+MODEL_EXAMPLES: dict[str, dict[str, Any]] = {
+    "Secret": {
+        "path": "secret/data/bike-data-flow/production/database",
+        "data": {"username": "db_user", "host": "db.example.com"},
+        "version": 3,
+        "created_time": "2026-01-10T10:00:00Z",
+    },
+    "VaultSecret": {
+        "path": "bike-data-flow/production/database",
+        "data": {"username": "db_user", "password": "secret123"},
+        "version": 2,
+    },
+    "SecretMetadata": {
+        "secret_path": "secret/data/bike-data-flow/production/database",
+        "created_time": "2026-01-10T10:00:00Z",
+        "destroyed": False,
+        "version": 3,
+    },
+    "PolicyRule": {
+        "path": "secret/data/bike-data-flow/production/*",
+        "capabilities": ["read"],
+        "description": "Read access to all production secrets",
+    },
+    "AccessPolicy": {
+        "name": "dagster-secrets",
+        "rules": [
+            {
+                "path": "secret/data/bike-data-flow/production/*",
+                "capabilities": ["read"],
+                "description": "Read access to production secrets",
             }
-        }
+        ],
+        "description": "Dagster pipeline access to secrets",
+    },
+    "ListenerConfig": {
+        "type": "tcp",
+        "address": "0.0.0.0:8200",
+        "cluster_address": "0.0.0.0:8201",
+    },
+    "TLSConfig": {
+        "enabled": True,
+        "cert_file": "/etc/vault.d/tls/vault.crt",
+        "key_file": "/etc/vault.d/tls/vault.key",
+        "min_version": "tls12",
+    },
+    "SealConfig": {
+        "type": "shamir",
+        "disabled": False,
+    },
+    "TelemetryConfig": {
+        "statsite_address": "10.0.0.1:8125",
+        "disable_hostname": False,
+    },
+    "VaultConfig": {
+        "storage_backend": "raft",
+        "listener": {
+            "type": "tcp",
+            "address": "0.0.0.0:8200",
+            "cluster_address": "0.0.0.0:8201",
+        },
+        "tls": {
+            "enabled": True,
+            "cert_file": "/etc/vault.d/tls/vault.crt",
+            "key_file": "/etc/vault.d/tls/vault.key",
+            "min_version": "tls12",
+        },
+        "cluster_name": "bike-data-flow-vault",
+        "disable_mlock": True,
+    },
+    "VaultConnectionConfig": {
+        "vault_addr": "https://vault.example.com:8200",
+        "auth_method": "approle",
+        "role_id": "my-role-id",
+        "secret_id": "my-secret-id",
+        "timeout": 30,
+        "retries": 3,
+        "cache_ttl": 300,
+    },
+    "RotationHistory": {
+        "id": "rot-abc123",
+        "secret_path": "secret/data/bike-data-flow/production/database",
+        "rotation_type": "automatic",
+        "status": "success",
+        "timestamp": "2026-01-10T12:00:00Z",
+        "performed_by": "system-scheduler",
+        "duration_seconds": 2.5,
+        "previous_version": 5,
+        "new_version": 6,
+    },
+    "SecretRotationPolicy": {
+        "secret_path": "secret/data/bike-data-flow/production/api-key",
+        "rotation_type": "scheduled",
+        "rotation_period_days": 90,
+        "rotation_script_path": "/opt/vault/scripts/rotate-api-key.sh",
+        "last_rotated": "2025-10-12T10:00:00Z",
+        "is_active": True,
+        "cron_schedule": "0 2 * * 0",
+        "notify_on_failure": True,
+        "notify_emails": ["admin@bike-data-flow"],
+        "max_retries": 3,
+        "rollback_on_failure": True,
+    },
+    "AuditLog": {
+        "timestamp": "2026-01-10T10:30:00Z",
+        "accessor": "token-abcd1234",
+        "operation": "read",
+        "path": "secret/data/bike-data-flow/production/database",
+        "success": True,
+        "client_ip": "10.0.0.5",
+        "request_id": "req-xyz789",
+    },
+    "VaultHealth": {
+        "status": "unsealed",
+        "version": "1.15.0",
+        "cluster_id": "vault-cluster-1234",
+        "cluster_name": "bike-data-flow-vault",
+        "server_time_utc": "2026-01-10T10:30:00Z",
+    },
+}
+
+
+def json_schema_with_examples(model: type[BaseModel]) -> dict[str, Any]:
+    """Build a model's JSON schema including its example from MODEL_EXAMPLES.
+
+    Args:
+        model: Model class to describe
+
+    Returns:
+        JSON schema dict
+    """
+    schema = model.model_json_schema()
+    example = MODEL_EXAMPLES.get(model.__name__)
+    if example is not None:
+        schema["example"] = example
+    return schema
@@ -13,13 +13,157 @@ Features:
 
 import logging
 import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Final, Optional
 
-from wrm_pipeline.wrm_pipeline.vault.models import AccessPolicy, PolicyRule
+from wrm_pipeline.wrm_pipeline.vault.models import AccessPolicy, PolicyKey, PolicyRule
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import for validate_policy and parse_hcl
+_NAME_RE: Final = re.compile(r"^[a-zA-Z0-9_-]+$")
+_QUOTED_RE: Final = re.compile(r'"([^"]+)"')
+
+
+@lru_cache(maxsize=1)
+def _vault_resources() -> "Traversable":
+    """Resource root of this package, looked up on first use."""
+    import importlib.resources
+
+    return importlib.resources.files("wrm_pipeline.wrm_pipeline.vault")
+
+
+@lru_cache(maxsize=128)
+def _render_hcl(key: PolicyKey) -> str:
+    """Render a policy snapshot as HCL.
+
+    Cached, so syncing or saving the same policy repeatedly renders it once.
+
+    Args:
+        key: Policy snapshot from AccessPolicy.structural_key
+
+    Returns:
+        HCL-formatted policy string
+    """
+    name, description, rules = key
+
+    # Add header comment if description exists
+    if description:
+        header: tuple[str, ...] = (f"# {description}", f"# Policy: {name}", "")
+    else:
+        header = ()
+
+    # Header, policy name comment and path rules are joined in one pass
+    return "\n".join(
+        chain(
+            header,
+            (f"# Access policy: {name}", ""),
+            chain.from_iterable(_iter_rule_lines(*rule) for rule in rules),
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _render_hcl_bytes(key: PolicyKey) -> bytes:
+    """Render a policy snapshot as UTF-8 encoded HCL, cached like _render_hcl."""
+    return _render_hcl(key).encode("utf-8")
+
+
+def _iter_rule_lines(
+    path: str, capabilities: tuple[str, ...], description: Optional[str]
+) -> Iterator[str]:
+    """Yield the HCL lines for a single policy rule.
+
+    Args:
+        path: Rule path
+        capabilities: Rule capabilities
+        description: Optional rule description
+
+    Yields:
+        Lines of the HCL path block
+
+    Raises:
+        ValueError: If a capability is not a valid Vault capability
+    """
+    # Format capabilities as HCL array. They are joined unescaped, so a rule
+    # that bypassed PolicyRule validation must not inject arbitrary HCL.
+    if not PolicyManager.VALID_CAPABILITIES.issuperset(capabilities):
+        raise ValueError(f"Invalid capabilities in rule for {path!r}: {capabilities!r}")
+    if capabilities:
+        caps_str = '["' + '", "'.join(capabilities) + '"]'
+    else:
+        caps_str = "[]"
+
+    yield f'path "{path}" {{'
+    yield f"  capabilities = {caps_str}"
+
+    # Add description if present
+    if description:
+        yield f"  # {description}"
+
+    yield "}"
+
+
+def _parse_path_line(line: str) -> Optional[str]:
+    """Extract the path from a ``path "..." {`` line.
+
+    Args:
+        line: Stripped HCL line
+
+    Returns:
+        The quoted path, or None if the line does not open a path block
+    """
+    if not line.startswith("path") or line[4:5].strip():
+        return None
+    open_quote = line.find('"', 4)
+    close_quote = line.find('"', open_quote + 1)
+    if (
+        open_quote == -1
+        or close_quote <= open_quote + 1
+        or line[4:open_quote].strip()
+        or not line[close_quote + 1:].lstrip().startswith("{")
+    ):
+        return None
+    return line[open_quote + 1:close_quote]
+
+
+def _parse_capabilities_line(line: str) -> Optional[list[str]]:
+    """Extract the capabilities from a ``capabilities = [...]`` line.
+
+    Args:
+        line: Stripped HCL line
+
+    Returns:
+        The quoted capabilities, or None if the line is not a capabilities list
+    """
+    if not line.startswith("capabilities"):
+        return None
+    rest = line[12:].lstrip()
+    if not rest.startswith("="):
+        return None
+    rest = rest[1:].lstrip()
+    close = rest.rfind("]")
+    if not rest.startswith("[") or close < 1:
+        return None
+    inner = rest[1:close]
+    if not inner.strip():
+        return []
+    caps = []
+    for token in inner.split(","):
+        token = token.strip()
+        if len(token) < 3 or token[0] != '"' or token[-1] != '"' or '"' in token[1:-1]:
+            # Anything unusual goes through the full quoted-string scan
+            return _QUOTED_RE.findall(inner)
+        caps.append(token[1:-1])
+    return caps
+
 
 class PolicyValidationError(Exception):
     """Raised when policy validation fails."""
@@ -47,18 +191,23 @@ class PolicyManager:
     """
 
     # Valid capability values per Vault documentation
-    VALID_CAPABILITIES = frozenset({"create", "read", "update", "delete", "list", "patch", "sudo"})
+    VALID_CAPABILITIES: Final[frozenset[str]] = frozenset(
+        {"create", "read", "update", "delete", "list", "patch", "sudo"}
+    )
+    _SORTED_VALID_CAPABILITIES: Final[list[str]] = sorted(VALID_CAPABILITIES)
 
     # Reserved policy names that cannot be used
-    RESERVED_NAMES = frozenset({"root"})
+    RESERVED_NAMES: Final[frozenset[str]] = frozenset({"root"})
 
-    def __init__(self, policies_dir: Optional[str] = None):
+    def __init__(self, policies_dir: Optional[str] = None) -> None:
         """Initialize the policy manager.
 
         Args:
             policies_dir: Directory for storing policy files (optional)
         """
-        self.policies_dir = Path(policies_dir) if policies_dir else None
+        self.policies_dir: Optional[Path] = Path(policies_dir) if policies_dir else None
+        # Snapshots of policies that already passed validate_policy
+        self._validated: set[PolicyKey] = set()
 
     def create_policy(self, policy: AccessPolicy) -> AccessPolicy:
         """Validate and create a policy.
@@ -88,11 +237,15 @@ class PolicyManager:
         Raises:
             PolicyValidationError: If validation fails
         """
+        key = policy.structural_key
+        if key in self._validated:
+            return True
+
         # Check policy name
         if not policy.name:
             raise PolicyValidationError("Policy name is required")
 
-        if not re.match(r"^[a-zA-Z0-9_-]+$", policy.name):
+        if not _NAME_RE.match(policy.name):
             raise PolicyValidationError(
                 "Policy name must contain only alphanumeric characters, hyphens, and underscores"
             )
@@ -100,19 +253,22 @@ class PolicyManager:
         if policy.name in self.RESERVED_NAMES:
             raise PolicyValidationError(f"Policy name '{policy.name}' is reserved")
 
-        # Check for duplicate rules
-        seen_paths: dict[str, int] = {}
+        # Check for duplicate rules; the earlier index is only looked up
+        # when reporting one
+        seen_paths: set[str] = set()
         for i, rule in enumerate(policy.rules):
             if rule.path in seen_paths:
+                first = next(j for j, r in enumerate(policy.rules) if r.path == rule.path)
                 raise PolicyValidationError(
-                    f"Duplicate path rule at index {i} and {seen_paths[rule.path]}"
+                    f"Duplicate path rule at index {i} and {first}"
                 )
-            seen_paths[rule.path] = i
+            seen_paths.add(rule.path)
 
         # Validate each rule
         for rule in policy.rules:
             self._validate_policy_rule(rule)
 
+        self._validated.add(key)
         logger.info(f"Validated policy: {policy.name}")
         return True
 
@@ -133,12 +289,13 @@ class PolicyManager:
         if ".." in rule.path:
             raise PolicyValidationError(f"Invalid path with path traversal: {rule.path}")
 
-        # Validate capabilities
-        for cap in rule.capabilities:
-            if cap not in self.VALID_CAPABILITIES:
-                raise PolicyValidationError(
-                    f"Invalid capability '{cap}'. Must be one of {sorted(self.VALID_CAPABILITIES)}"
-                )
+        # Validate capabilities with one set operation; the offending one is
+        # only looked up when raising
+        if not self.VALID_CAPABILITIES.issuperset(rule.capabilities):
+            cap = next(c for c in rule.capabilities if c not in self.VALID_CAPABILITIES)
+            raise PolicyValidationError(
+                f"Invalid capability '{cap}'. Must be one of {self._SORTED_VALID_CAPABILITIES}"
+            )
 
     def to_hcl(self, policy: AccessPolicy) -> str:
         """Generate HCL-formatted policy string.
@@ -159,48 +316,18 @@ class PolicyManager:
               capabilities = ["read", "list"]
             }
         """
-        lines: list[str] = []
-
-        # Add header comment if description exists
-        if policy.description:
-            lines.append(f"# {policy.description}")
-            lines.append(f"# Policy: {policy.name}")
-            lines.append("")
-
-        # Add policy name as comment for clarity
-        lines.append(f"# Access policy: {policy.name}")
-        lines.append("")
-
-        # Generate path rules
-        for rule in policy.rules:
-            hcl_rule = self._rule_to_hcl(rule)
-            lines.append(hcl_rule)
+        return _render_hcl(policy.structural_key)
 
-        return "\n".join(lines)
-
-    def _rule_to_hcl(self, rule: PolicyRule) -> str:
-        """Convert a PolicyRule to HCL format.
+    def to_hcl_bytes(self, policy: AccessPolicy) -> bytes:
+        """Generate the HCL policy as UTF-8 encoded bytes.
 
         Args:
-            rule: PolicyRule to convert
+            policy: AccessPolicy model to convert
 
         Returns:
-            HCL-formatted rule string
+            HCL-formatted policy, encoded as UTF-8
         """
-        # Format capabilities as HCL array
-        caps_str = ", ".join(f'"{cap}"' for cap in rule.capabilities)
-
-        # Build the path block
-        lines = [f'path "{rule.path}" {{']
-        lines.append(f"  capabilities = [{caps_str}]")
-
-        # Add description if present
-        if rule.description:
-            lines.append(f"  # {rule.description}")
-
-        lines.append("}")
-
-        return "\n".join(lines)
+        return _render_hcl_bytes(policy.structural_key)
 
     def parse_hcl(self, hcl_content: str) -> AccessPolicy:
         """Parse HCL content into an AccessPolicy model.
@@ -214,74 +341,70 @@ class PolicyManager:
         Raises:
             PolicyValidationError: If parsing fails
         """
-        # Simple HCL parser for Vault policies
-        # Vault policies use a simple format that we can parse with regex
-        lines = hcl_content.strip().split("\n")
-
-        # Extract policy name from comment if available
+        # Simple HCL parser for Vault policies, reading the content in one
+        # pass and dispatching on the first character of each line
         policy_name = None
         description = None
 
-        for line in lines:
-            if line.startswith("# Policy:"):
-                policy_name = line.replace("# Policy:", "").strip()
-            elif line.startswith("#"):
-                description = line.replace("#", "").strip()
-
-        if not policy_name:
-            raise PolicyValidationError("Could not determine policy name from HCL content")
-
-        # Parse path rules
-        rules: list[PolicyRule] = []
+        # (path, capabilities, description) per rule; models are built once
+        # the policy name is known to be present
+        parsed: list[tuple[str, list[str], Optional[str]]] = []
         current_path = None
         current_caps: list[str] = []
         current_desc = None
 
-        for line in lines:
-            line = line.strip()
-
-            # Skip comments (except the policy name we already extracted)
-            if line.startswith("#") or not line:
+        for raw in hcl_content.strip().split("\n"):
+            # Header comments only count when they start the line. The
+            # description is the comment just above "# Policy:"; once the name
+            # is known, later comments are ordinary comments.
+            if raw[:1] == "#":
+                if policy_name is None:
+                    if raw.startswith("# Policy:"):
+                        policy_name = raw[9:].strip()
+                    else:
+                        description = raw[1:].strip()
                 continue
 
-            # Check for path definition
-            path_match = re.match(r'path\s+"([^"]+)"\s*\{', line)
-            if path_match:
-                # Save previous rule if exists
-                if current_path:
-                    rules.append(PolicyRule(
-                        path=current_path,
-                        capabilities=current_caps,
-                        description=current_desc,
-                    ))
-
-                current_path = path_match.group(1)
-                current_caps = []
-                current_desc = None
+            line = raw.strip()
+            if not line:
                 continue
+            first = line[0]
 
-            # Check for capabilities
-            caps_match = re.match(r'capabilities\s*=\s*\[(.*)\]', line)
-            if caps_match and current_path:
-                caps_str = caps_match.group(1)
-                # Parse capability strings
-                current_caps = re.findall(r'"([^"]+)"', caps_str)
+            # Skip comments
+            if first == "#":
                 continue
 
-            # Check for closing brace
-            if line == "}":
-                if current_path:
-                    rules.append(PolicyRule(
-                        path=current_path,
-                        capabilities=current_caps,
-                        description=current_desc,
-                    ))
+            if first == "}":
+                if line == "}" and current_path:
+                    parsed.append((current_path, current_caps, current_desc))
                     current_path = None
                 continue
 
+            if first == "p":
+                path = _parse_path_line(line)
+                if path is not None:
+                    # Save previous rule if exists
+                    if current_path:
+                        parsed.append((current_path, current_caps, current_desc))
+                    current_path = path
+                    current_caps = []
+                    current_desc = None
+                continue
+
+            if first == "c" and current_path:
+                caps = _parse_capabilities_line(line)
+                if caps is not None:
+                    current_caps = caps
+
+        if not policy_name:
+            raise PolicyValidationError("Could not determine policy name from HCL content")
+
         return AccessPolicy(
             name=policy_name,
-            rules=rules,
+            rules=[
+                PolicyRule(path=path, capabilities=caps, description=desc)
+                for path, caps, desc in parsed
+            ],
             description=description,
         )
 
@@ -309,6 +432,45 @@ class PolicyManager:
             logger.error(f"Failed to sync policy '{policy.name}' to Vault: {e}")
             raise
 
+    def sync_policies(
+        self,
+        client,
+        policies: Iterable[AccessPolicy],
+        max_workers: int = 8,
+    ) -> None:
+        """Sync several policies to Vault concurrently.
+
+        Every policy is validated before any request is sent, so an invalid
+        policy leaves Vault untouched. The writes then run on a thread pool,
+        overlapping their network round-trips.
+
+        Args:
+            client: Authenticated Vault client
+            policies: AccessPolicy models to sync
+            max_workers: Maximum number of concurrent requests
+
+        Raises:
+            PolicyValidationError: If any policy fails validation
+            VaultError: If a Vault operation fails
+        """
+        policies = list(policies)
+        for policy in policies:
+            self.validate_policy(policy)
+
+        if not policies:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(policies)),
+            thread_name_prefix="vault-policy-sync",
+        ) as executor:
+            futures = [
+                executor.submit(self.sync_policy, client, policy)
+                for policy in policies
+            ]
+            for future in as_completed(futures):
+                future.result()
+
     def list_policies(self, client) -> list[str]:
         """List all policies in Vault.
 
@@ -375,6 +537,22 @@ class PolicyManager:
         except Exception:
             return False
 
+    def policies_exist(self, client, names: Iterable[str]) -> dict[str, bool]:
+        """Check which of several policies exist in Vault.
+
+        Lists the policies once instead of reading each name, so checking
+        many names costs a single request.
+
+        Args:
+            client: Authenticated Vault client
+            names: Policy names to check
+
+        Returns:
+            Mapping of each name to whether the policy exists
+        """
+        existing = frozenset(self.list_policies(client))
+        return {name: name in existing for name in names}
+
     def save_policy_file(self, policy: AccessPolicy, path: Optional[str] = None) -> Path:
         """Save a policy to a file.
 
@@ -390,10 +568,9 @@ class PolicyManager:
                 raise ValueError("policies_dir must be set to save policy files")
             path = self.policies_dir / f"{policy.name}.hcl"
 
-        hcl = self.to_hcl(policy)
         file_path = Path(path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(hcl)
+        file_path.write_bytes(self.to_hcl_bytes(policy))
 
         logger.info(f"Saved policy file: {file_path}")
         return file_path
@@ -422,21 +599,17 @@ class PolicyManager:
         Raises:
             FileNotFoundError: If policy file not found
         """
-        import importlib.resources
-
         policy_path = f"policies/{name}.hcl"
 
         try:
-            # Try to read from package resources
-            if importlib.resources.files("wrm_pipeline.wrm_pipeline.vault").joinpath(policy_path).is_file():
-                hcl_content = (
-                    importlib.resources.files("wrm_pipeline.wrm_pipeline.vault")
-                    .joinpath(policy_path)
-                    .read_text()
-                )
-                return self.parse_hcl(hcl_content)
-        except (ModuleNotFoundError, FileNotFoundError, TypeError):
+            # Try to read from package resources; a missing file raises
+            hcl_content = (
+                _vault_resources().joinpath(policy_path).read_text(encoding="utf-8")
+            )
+        except (ModuleNotFoundError, FileNotFoundError, IsADirectoryError, TypeError):
             pass
+        else:
+            return self.parse_hcl(hcl_content)
 
         # Fallback: check local policies directory
         local_path = Path(f"config/vault/policies/{name}.hcl")
@@ -464,18 +637,7 @@ class PolicyManager:
         return AccessPolicy(
             name=name,
             description=description or "Read-only access to all secrets",
-            rules=[
-                PolicyRule(
-                    path=f"{base_path}/*",
-                    capabilities=["read", "list"],
-                    description="Read and list all secrets",
-                ),
-                PolicyRule(
-                    path=f"{base_path}",
-                    capabilities=["list"],
-                    description="List secrets at root",
-                ),
-            ],
+            rules=_readonly_rules(base_path),
         )
 
     def generate_dagster_policy(
@@ -497,23 +659,7 @@ class PolicyManager:
         return AccessPolicy(
             name=name,
             description=description or "Dagster pipeline access to secrets",
-            rules=[
-                PolicyRule(
-                    path=f"{base_path}/{{app,database,api,storage}}/*",
-                    capabilities=["read", "list"],
-                    description="Read access to app, database, api, and storage secrets",
-                ),
-                PolicyRule(
-                    path=f"{base_path}/{{app,database,api,storage}}",
-                    capabilities=["list"],
-                    description="List secret categories",
-                ),
-                PolicyRule(
-                    path=f"{base_path}/{{app,database,api,storage}}/*",
-                    capabilities=["read"],
-                    description="Read secrets in all categories",
-                ),
-            ],
+            rules=_dagster_rules(base_path),
         )
 
     def generate_admin_policy(
@@ -535,16 +681,63 @@ class PolicyManager:
         return AccessPolicy(
             name=name,
             description=description or "Full admin access to all secrets",
-            rules=[
-                PolicyRule(
-                    path=f"{base_path}/*",
-                    capabilities=["create", "read", "update", "delete", "list", "sudo"],
-                    description="Full access to all secrets",
-                ),
-                PolicyRule(
-                    path=f"{base_path}",
-                    capabilities=["create", "read", "update", "delete", "list"],
-                    description="Full access at root level",
-                ),
-            ],
+            rules=_admin_rules(base_path),
         )
+
+
+# Rules of the generated policies, built once per base path and shared by
+# every policy generated for it
+@lru_cache(maxsize=None)
+def _readonly_rules(base_path: str) -> tuple[PolicyRule, ...]:
+    """Rules for PolicyManager.generate_readonly_policy."""
+    return (
+        PolicyRule(
+            path=f"{base_path}/*",
+            capabilities=("read", "list"),
+            description="Read and list all secrets",
+        ),
+        PolicyRule(
+            path=f"{base_path}",
+            capabilities=("list",),
+            description="List secrets at root",
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _dagster_rules(base_path: str) -> tuple[PolicyRule, ...]:
+    """Rules for PolicyManager.generate_dagster_policy."""
+    return (
+        PolicyRule(
+            path=f"{base_path}/{{app,database,api,storage}}/*",
+            capabilities=("read", "list"),
+            description="Read access to app, database, api, and storage secrets",
+        ),
+        PolicyRule(
+            path=f"{base_path}/{{app,database,api,storage}}",
+            capabilities=("list",),
+            description="List secret categories",
+        ),
+        PolicyRule(
+            path=f"{base_path}/{{app,database,api,storage}}/*",
+            capabilities=("read",),
+            description="Read secrets in all categories",
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _admin_rules(base_path: str) -> tuple[PolicyRule, ...]:
+    """Rules for PolicyManager.generate_admin_policy."""
+    return (
+        PolicyRule(
+            path=f"{base_path}/*",
+            capabilities=("create", "read", "update", "delete", "list", "sudo"),
+            description="Full access to all secrets",
+        ),
+        PolicyRule(
+            path=f"{base_path}",
+            capabilities=("create", "read", "update", "delete", "list"),
+            description="Full access at root level",
+        ),
+    )
@@ -4,13 +4,19 @@ This module provides a Dagster resource that integrates with HashiCorp Vault
 for secure secret retrieval in pipeline execution.
 """
 
+import asyncio
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from threading import Lock
 from typing import Any, Optional
 
+import requests
 from dagster import ResourceDefinition
 
+from wrm_pipeline.wrm_pipeline.vault.async_client import AsyncVaultClient
 from wrm_pipeline.wrm_pipeline.vault.client import VaultClient
 from wrm_pipeline.wrm_pipeline.vault.exceptions import (
     VaultAuthenticationError,
@@ -37,6 +43,8 @@ class VaultSecretsResourceConfig:
         timeout: Request timeout in seconds
         retries: Number of retry attempts
         cache_ttl: Cache TTL in seconds (default: 300 = 5 minutes)
+        cache_max_entries: Maximum number of cached entries; the least
+            recently used entry is evicted beyond this (default: 1024)
         verify: Whether to verify TLS certificates
     """
 
@@ -49,6 +57,7 @@ class VaultSecretsResourceConfig:
     timeout: int = 30
     retries: int = 3
     cache_ttl: int = 300
+    cache_max_entries: int = 1024
     verify: bool = True
 
     def to_connection_config(self) -> VaultConnectionConfig:
@@ -90,15 +99,37 @@ class VaultSecretsResource:
         client: The underlying VaultClient instance.
     """
 
-    def __init__(self, config: VaultSecretsResourceConfig):
+    def __init__(
+        self,
+        config: VaultSecretsResourceConfig,
+        http_session: Optional[requests.Session] = None,
+    ):
         """Initialize the Vault secrets resource.
 
         Args:
             config: Configuration for the Vault connection.
+            http_session: Optional HTTP session for the client to send
+                requests through. By default the client uses the pooled
+                keep-alive session it shares with other clients of the same
+                Vault server. A supplied session stays open on close(), and
+                its own adapters decide retries. Its TLS verification must
+                match ``config.verify``, or creating the client raises
+                ValueError.
         """
         self.config = config
+        self._http_session = http_session
         self._client: Optional[VaultClient] = None
-        self._cache: dict[str, tuple[Any, float]] = {}
+        # Async clients by the event loop their connection was opened on;
+        # a connection can only be used and closed on its own loop
+        self._async_clients: dict[asyncio.AbstractEventLoop, AsyncVaultClient] = {}
+        self._async_clients_lock = Lock()
+        # Cached values with their monotonic expiry, least recently used first
+        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._cache_lock = Lock()
+        # Locks of cache keys being refetched, so concurrent misses for the
+        # same secret trigger a single read
+        self._fetch_locks: dict[str, Lock] = {}
+        self._locks_guard = Lock()
 
     @property
     def client(self) -> VaultClient:
@@ -113,9 +144,46 @@ class VaultSecretsResource:
         """
         if self._client is None:
             connection_config = self.config.to_connection_config()
-            self._client = VaultClient(connection_config, verify=self.config.verify)
+            self._client = VaultClient(
+                connection_config,
+                verify=self.config.verify,
+                http_session=self._http_session,
+            )
         return self._client
 
+    def _aclient(self) -> AsyncVaultClient:
+        """Get or create the async client for the running event loop.
+
+        Each loop gets its own client, sharing :attr:`client`'s token and
+        cache. Clients of loops that have since been closed are dropped.
+
+        Returns:
+            AsyncVaultClient instance for concurrent reads.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            async_client = self._async_clients.get(loop)
+            if async_client is None:
+                self._drop_closed_loops()
+                async_client = self._async_clients[loop] = AsyncVaultClient(
+                    self.client
+                )
+        return async_client
+
+    def _drop_closed_loops(self) -> None:
+        """Forget async clients whose event loop is closed.
+
+        Must be called with ``_async_clients_lock`` held. Their connections
+        can no longer be closed cleanly; :meth:`aclose` should have been
+        awaited before the loop ended.
+        """
+        for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+            del self._async_clients[loop]
+            logger.warning(
+                "Event loop closed without awaiting VaultSecretsResource.aclose(); "
+                "its Vault connection was not closed cleanly"
+            )
+
     def _get_cache_key(self, path: str, version: Optional[int] = None) -> str:
         """Generate a cache key for a secret path.
 
@@ -128,44 +196,46 @@ class VaultSecretsResource:
         """
         return f"{path}:{version}" if version else path
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached value is still valid.
-
-        Args:
-            cache_key: Cache key to check.
-
-        Returns:
-            True if cache entry exists and is not expired.
-        """
-        if cache_key not in self._cache:
-            return False
-        _, expiry = self._cache[cache_key]
-        return expiry > time.time()
-
     def _get_from_cache(self, cache_key: str) -> Optional[Any]:
         """Get value from cache if valid.
 
+        A hit marks the entry as most recently used; an expired entry is
+        dropped.
+
         Args:
             cache_key: Cache key to retrieve.
 
         Returns:
             Cached value or None if not found/expired.
         """
-        if self._is_cache_valid(cache_key):
-            value, _ = self._cache[cache_key]
-            logger.debug(f"Cache hit for {cache_key}")
-            return value
-        return None
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            value, expiry = entry
+            if expiry <= time.monotonic():
+                del self._cache[cache_key]
+                return None
+            self._cache.move_to_end(cache_key)
+        logger.debug(f"Cache hit for {cache_key}")
+        return value
 
     def _set_cache(self, cache_key: str, value: Any) -> None:
         """Store value in cache with TTL.
 
+        Evicts the least recently used entries once the cache holds more
+        than ``cache_max_entries``.
+
         Args:
             cache_key: Cache key.
             value: Value to cache.
         """
-        expiry = time.time() + self.config.cache_ttl
-        self._cache[cache_key] = (value, expiry)
+        expiry = time.monotonic() + self.config.cache_ttl
+        with self._cache_lock:
+            self._cache[cache_key] = (value, expiry)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.config.cache_max_entries:
+                self._cache.popitem(last=False)
         logger.debug(f"Cached {cache_key} with TTL {self.config.cache_ttl}s")
 
     # =====================================================================
@@ -196,27 +266,127 @@ class VaultSecretsResource:
             VaultAuthenticationError: If authentication fails.
             VaultConnectionError: If Vault is unreachable.
         """
+        if not use_cache:
+            return self._fetch_secret(path, version, use_cache=False)
+
         cache_key = self._get_cache_key(path, version)
+        cached_value = self._get_from_cache(cache_key)
+        if cached_value is not None:
+            return cached_value
+
+        # One thread per key refetches a missing or expired secret; the others
+        # wait on its lock and pick the result up from the cache
+        with self._locks_guard:
+            lock = self._fetch_locks.setdefault(cache_key, Lock())
+        with lock:
+            try:
+                cached_value = self._get_from_cache(cache_key)
+                if cached_value is not None:
+                    return cached_value
+                result = self._fetch_secret(path, version, use_cache=True)
+                self._set_cache(cache_key, result)
+                return result
+            finally:
+                # Dropped only once the result is cached, so a thread that
+                # misses afterwards finds the value rather than a fresh lock
+                with self._locks_guard:
+                    if self._fetch_locks.get(cache_key) is lock:
+                        del self._fetch_locks[cache_key]
+
+    def _fetch_secret(
+        self,
+        path: str,
+        version: Optional[int],
+        use_cache: bool,
+    ) -> dict[str, Any]:
+        """Read a secret through the client, bypassing the resource cache.
 
-        if use_cache:
-            cached_value = self._get_from_cache(cache_key)
-            if cached_value is not None:
-                return cached_value
+        Args:
+            path: Path to the secret.
+            version: Optional specific version to retrieve.
+            use_cache: Whether the client may serve the secret from its cache.
 
+        Returns:
+            Dictionary containing secret data.
+
+        Raises:
+            VaultSecretNotFoundError: If secret doesn't exist.
+            VaultAuthenticationError: If authentication fails.
+            VaultConnectionError: If Vault is unreachable.
+        """
         try:
             vault_secret = self.client.get_secret(
                 path=path,
                 version=version,
                 use_cache=use_cache,
             )
+            return dict(vault_secret.data)
+
+        except VaultSecretNotFoundError:
+            raise
+        except VaultAuthenticationError:
+            raise
+        except VaultConnectionError:
+            raise
+        except VaultError as e:
+            raise VaultConnectionError(f"Failed to retrieve secret: {e}") from e
 
-            result = vault_secret.data
+    def get_secrets(self, paths: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several secrets from Vault in one batch.
 
-            if use_cache:
-                self._set_cache(cache_key, result)
+        Cached secrets are returned directly; the remaining paths are read
+        concurrently through :meth:`VaultClient.get_secrets` and cached.
+        Unlike :meth:`get_secret`, a failure for one path does not raise: it
+        is logged and the path is left out of the result.
+
+        Args:
+            paths: Paths to the secrets (e.g., 'bike-data-flow/production/database').
+
+        Returns:
+            Mapping of path to secret data, in the order the paths were given,
+            for every path that was read.
+        """
+        results: dict[str, Optional[dict[str, Any]]] = {}
+        misses: list[str] = []
+        for path in dict.fromkeys(paths):
+            cached_value = self._get_from_cache(path)
+            results[path] = cached_value
+            if cached_value is None:
+                misses.append(path)
 
-            return result
+        if misses:
+            for path, vault_secret in self.client.get_secrets(misses).items():
+                result = dict(vault_secret.data)
+                self._set_cache(path, result)
+                results[path] = result
 
+        return {path: value for path, value in results.items() if value is not None}
+
+    async def aget_secret(self, path: str, use_cache: bool = True) -> dict[str, Any]:
+        """Retrieve a secret from Vault without blocking the event loop.
+
+        Async counterpart of :meth:`get_secret` for the latest version of a
+        secret. Results share the cache with the synchronous methods.
+
+        Args:
+            path: Path to the secret (e.g., 'bike-data-flow/production/database').
+            use_cache: Whether to use cached value (default: True).
+
+        Returns:
+            Dictionary containing secret data.
+
+        Raises:
+            VaultSecretNotFoundError: If secret doesn't exist.
+            VaultAuthenticationError: If authentication fails.
+            VaultConnectionError: If Vault is unreachable.
+        """
+        if use_cache:
+            cached_value = self._get_from_cache(path)
+            if cached_value is not None:
+                return cached_value
+
+        try:
+            vault_secret = await self._aclient().aget_secret(path)
         except VaultSecretNotFoundError:
             raise
         except VaultAuthenticationError:
@@ -226,6 +396,42 @@ class VaultSecretsResource:
         except VaultError as e:
             raise VaultConnectionError(f"Failed to retrieve secret: {e}") from e
 
+        result = dict(vault_secret.data)
+        if use_cache:
+            self._set_cache(path, result)
+        return result
+
+    async def aget_secrets(self, paths: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several secrets concurrently without blocking the event loop.
+
+        Async counterpart of :meth:`get_secrets`: cache misses are read
+        concurrently over the async client's single HTTP/2 connection, and a
+        failure for one path is logged and the path left out of the result.
+
+        Args:
+            paths: Paths to the secrets.
+
+        Returns:
+            Mapping of path to secret data, in the order the paths were given,
+            for every path that was read.
+        """
+        results: dict[str, Optional[dict[str, Any]]] = {}
+        misses: list[str] = []
+        for path in dict.fromkeys(paths):
+            cached_value = self._get_from_cache(path)
+            results[path] = cached_value
+            if cached_value is None:
+                misses.append(path)
+
+        if misses:
+            secrets = await self._aclient().aget_secrets(misses)
+            for path, vault_secret in secrets.items():
+                result = dict(vault_secret.data)
+                self._set_cache(path, result)
+                results[path] = result
+
+        return {path: value for path, value in results.items() if value is not None}
+
     def get_database_credentials(
         self,
         database_path: str = "bike-data-flow/production/database",
@@ -341,6 +547,24 @@ class VaultSecretsResource:
         except VaultError as e:
             raise VaultConnectionError(f"Failed to list secrets: {e}") from e
 
+    async def alist_secrets(self, path: str, use_cache: bool = True) -> list[str]:
+        """List secret paths under a given path without blocking the event loop.
+
+        The listing runs :meth:`list_secrets` on a worker thread.
+
+        Args:
+            path: Parent path to list secrets under.
+            use_cache: Whether to use cached value (default: True).
+
+        Returns:
+            List of secret names/paths. Empty list if path doesn't exist.
+
+        Raises:
+            VaultAuthenticationError: If authentication fails.
+            VaultConnectionError: If Vault is unreachable.
+        """
+        return await asyncio.to_thread(self.list_secrets, path, use_cache)
+
     def health_check(self) -> dict[str, Any]:
         """Perform a health check on the Vault server.
 
@@ -368,12 +592,12 @@ class VaultSecretsResource:
 
             return {
                 "healthy": (
-                    health.status.value != "sealed"
-                    and health.status.value != "disabled"
+                    health.status != "sealed"
+                    and health.status != "disabled"
                 ),
-                "initialized": health.status.value != "uninitialized",
-                "sealed": health.status.value == "sealed",
-                "status": health.status.value,
+                "initialized": health.status != "uninitialized",
+                "sealed": health.status == "sealed",
+                "status": health.status,
                 "version": health.version,
                 "cluster_id": health.cluster_id,
                 "cluster_name": health.cluster_name,
@@ -408,14 +632,54 @@ class VaultSecretsResource:
     def close(self) -> None:
         """Close the resource and cleanup resources.
 
-        Closes the underlying Vault client and clears the cache.
+        Closes the async clients' connections, the underlying Vault client
+        and clears the cache.
         """
+        self._close_async_clients()
         if self._client is not None:
             self._client.close()
             self._client = None
         self._cache.clear()
         logger.info("VaultSecretsResource closed")
 
+    def _close_async_clients(self) -> None:
+        """Close the async clients' connections from synchronous code.
+
+        Each connection is closed on its own event loop: scheduled on it if
+        the loop is running, run on it if the loop is open but idle.
+        """
+        with self._async_clients_lock:
+            self._drop_closed_loops()
+            async_clients, self._async_clients = self._async_clients, {}
+
+        for loop, async_client in async_clients.items():
+            if loop.is_running():
+                # Thread-safe, so close() may be called from any thread
+                asyncio.run_coroutine_threadsafe(async_client.aclose(), loop)
+            else:
+                loop.run_until_complete(async_client.aclose())
+
+    async def aclose(self) -> None:
+        """Close the running loop's async connection, then the resource itself.
+
+        Await this before the event loop ends when the async methods were
+        used, so the connection is closed on the loop it was opened on.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            async_client = self._async_clients.pop(loop, None)
+        if async_client is not None:
+            await async_client.aclose()
+        self.close()
+
+    def teardown_after_execution(self, context: Any) -> None:
+        """Release the resource once the Dagster run no longer needs it.
+
+        Args:
+            context: Dagster resource context (unused).
+        """
+        self.close()
+
 
 # =====================================================================
 # Resource Definition Factory
@@ -454,8 +718,8 @@ def vault_secrets_resource(
     """
     effective_config = config if config is not None else VaultSecretsResourceConfig()
 
-    def create_resource(context) -> VaultSecretsResource:
-        """Resource creation function for Dagster."""
+    def create_resource(context) -> Iterator[VaultSecretsResource]:
+        """Resource creation function for Dagster, closing it at teardown."""
         init_config = effective_config
 
         # Allow runtime config override from Dagster context
@@ -471,12 +735,18 @@ def vault_secrets_resource(
                 timeout=run_config.get("timeout", effective_config.timeout),
                 retries=run_config.get("retries", effective_config.retries),
                 cache_ttl=run_config.get("cache_ttl", effective_config.cache_ttl),
+                cache_max_entries=run_config.get(
+                    "cache_max_entries", effective_config.cache_max_entries
+                ),
                 verify=run_config.get("verify", effective_config.verify),
             )
 
         resource = VaultSecretsResource(init_config)
         logger.info(f"VaultSecretsResource initialized with config: {init_config}")
-        return resource
+        try:
+            yield resource
+        finally:
+            resource.teardown_after_execution(context)
 
     return ResourceDefinition(
         resource_def=create_resource,
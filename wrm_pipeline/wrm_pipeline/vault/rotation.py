@@ -16,6 +16,8 @@ from typing import Any, Optional
 from pydantic import BaseModel
 
 from wrm_pipeline.wrm_pipeline.vault.models import (
+    ROTATION_STATUS_BY_VALUE,
+    ROTATION_TYPE_BY_VALUE,
     RotationHistory,
     RotationStatus,
     RotationType,
@@ -40,6 +42,7 @@ class ScheduledRotation:
     """Represents a scheduled rotation in the scheduler."""
 
     policy: SecretRotationPolicy
+    next_run: Optional[datetime] = None
     last_checked: Optional[datetime] = None
     retry_count: int = 0
     status: str = "pending"
@@ -89,18 +92,21 @@ class RotationHistoryTracker:
         rotation_id = f"rot-{uuid.uuid4().hex[:8]}"
         now = datetime.utcnow()
 
-        history = RotationHistory(
+        # Every field comes typed from the scheduler, so the record is built
+        # without running validation; enums are stored by value, matching
+        # what validation with use_enum_values would produce
+        history = RotationHistory.model_construct(
             id=rotation_id,
             secret_path=secret_path,
-            rotation_type=rotation_type,
-            status=status,
+            rotation_type=ROTATION_TYPE_BY_VALUE[rotation_type].value,
+            status=ROTATION_STATUS_BY_VALUE[status].value,
             timestamp=now,
             performed_by=performed_by,
             error_message=error_message,
             duration_seconds=duration_seconds,
             previous_version=previous_version,
             new_version=new_version,
-            metadata=metadata,
+            metadata=metadata if metadata is not None else {},
         )
 
         # Store in memory
@@ -114,7 +120,7 @@ class RotationHistoryTracker:
 
         logger.info(
             f"Recorded rotation history: {rotation_id} for {secret_path}, "
-            f"status={status.value}"
+            f"status={history.status}"
         )
 
         return history
@@ -250,19 +256,19 @@ class RotationScheduler:
             logger.warning(f"Cannot schedule inactive rotation for {policy.secret_path}")
             return False
 
-        # Calculate next rotation if not set
-        if policy.next_rotation is None:
-            policy.next_rotation = self._calculate_next_rotation(
-                policy, schedule_type
-            )
+        # Follow the rotation period from the last rotation unless a cron
+        # schedule applies; otherwise calculate from now
+        next_run = None if policy.cron_schedule else policy.next_rotation
+        if next_run is None:
+            next_run = self._calculate_next_rotation(policy, schedule_type)
 
         # Store in schedule
-        scheduled = ScheduledRotation(policy=policy)
+        scheduled = ScheduledRotation(policy=policy, next_run=next_run)
         self._scheduled_rotations[policy.secret_path] = scheduled
 
         logger.info(
             f"Scheduled rotation for {policy.secret_path}, "
-            f"next_rotation={policy.next_rotation.isoformat()}"
+            f"next_rotation={next_run.isoformat()}"
         )
 
         return True
@@ -384,8 +390,8 @@ class RotationScheduler:
             # Check if rotation is due
             is_due = (
                 force
-                or policy.next_rotation is None
-                or now >= policy.next_rotation
+                or scheduled.next_run is None
+                or now >= scheduled.next_run
             )
 
             if is_due:
@@ -399,11 +405,11 @@ class RotationScheduler:
 
                     # Update next rotation time
                     if policy.rotation_period_days:
-                        policy.next_rotation = now + timedelta(
+                        scheduled.next_run = now + timedelta(
                             days=policy.rotation_period_days
                         )
                     elif policy.cron_schedule:
-                        policy.next_rotation = self._parse_cron_schedule(
+                        scheduled.next_run = self._parse_cron_schedule(
                             policy.cron_schedule, now
                         )
 
@@ -588,7 +594,7 @@ class RotationScheduler:
             "is_active": policy.is_active,
             "rotation_type": policy.rotation_type.value,
             "last_rotated": policy.last_rotated.isoformat() if policy.last_rotated else None,
-            "next_rotation": policy.next_rotation.isoformat() if policy.next_rotation else None,
+            "next_rotation": scheduled.next_run.isoformat() if scheduled.next_run else None,
             "rotation_period_days": policy.rotation_period_days,
             "cron_schedule": policy.cron_schedule,
             "stats": self._history_tracker.get_rotation_stats(secret_path),
@@ -605,7 +611,7 @@ class RotationScheduler:
 
         for scheduled in self._scheduled_rotations.values():
             policy = scheduled.policy
-            if policy.is_active and policy.next_rotation and now >= policy.next_rotation:
+            if policy.is_active and scheduled.next_run and now >= scheduled.next_run:
                 due.append(policy)
 
         return due
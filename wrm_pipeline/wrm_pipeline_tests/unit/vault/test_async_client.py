@@ -0,0 +1,114 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault.async_client import AsyncVaultClient
+from wrm_pipeline.wrm_pipeline.vault.client import VaultClient
+from wrm_pipeline.wrm_pipeline.vault.exceptions import VaultSecretNotFoundError
+from wrm_pipeline.wrm_pipeline.vault.models import VaultConnectionConfig
+
+
+class TestAsyncVaultClient:
+
+    @pytest.fixture
+    def requests_seen(self):
+        return []
+
+    @pytest.fixture
+    def client(self):
+        """Token-authenticated VaultClient recording the thread it logs in on"""
+        client = VaultClient(
+            VaultConnectionConfig(
+                vault_addr="https://vault.test:8200",
+                auth_method="token",
+                token="test-token",
+            )
+        )
+        client.login_threads = []
+        authenticate = client._authenticate
+
+        def recording_authenticate():
+            client.login_threads.append(threading.current_thread())
+            authenticate()
+
+        client._authenticate = recording_authenticate
+        yield client
+        client.close()
+
+    @pytest.fixture
+    def async_client(self, client, requests_seen):
+        """AsyncVaultClient answering KV v2 reads from an in-memory handler"""
+
+        def handler(request):
+            requests_seen.append(request)
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={"errors": []})
+            return httpx.Response(
+                200,
+                json={"data": {"data": {"key": "value"}, "metadata": {"version": 4}}},
+            )
+
+        async_client = AsyncVaultClient(client)
+        async_client._http = httpx.AsyncClient(
+            base_url=client.config.vault_addr,
+            transport=httpx.MockTransport(handler),
+        )
+        return async_client
+
+    def test_creating_the_client_does_not_log_in(self, client):
+        AsyncVaultClient(client)
+
+        assert client.login_threads == []
+
+    def test_login_runs_off_the_event_loop_thread(self, client, async_client):
+        async def read():
+            loop_thread = threading.current_thread()
+            secret = await async_client.aget_secret("app/db")
+            await async_client.aclose()
+            return loop_thread, secret
+
+        loop_thread, secret = asyncio.run(read())
+
+        assert secret.data == {"key": "value"}
+        assert len(client.login_threads) == 1
+        assert client.login_threads[0] is not loop_thread
+
+    def test_authenticated_client_does_not_log_in_again(self, client, async_client):
+        client._ensure_authenticated()
+
+        async def read():
+            await async_client.aget_secret("app/db")
+            await async_client.aclose()
+
+        asyncio.run(read())
+
+        assert len(client.login_threads) == 1
+
+    def test_reads_use_the_client_mount_point(
+        self, client, async_client, requests_seen
+    ):
+        client._mount_point = "kv"
+
+        async def read():
+            await async_client.aget_secret("secret/data/app/db")
+            await async_client.aclose()
+
+        asyncio.run(read())
+
+        assert requests_seen[0].url.path == "/v1/kv/data/app/db"
+
+    def test_missing_secret_is_negative_cached(
+        self, client, async_client, requests_seen
+    ):
+        async def read():
+            with pytest.raises(VaultSecretNotFoundError):
+                await async_client.aget_secret("missing")
+            await async_client.aclose()
+
+        asyncio.run(read())
+
+        with pytest.raises(VaultSecretNotFoundError):
+            client.get_secret("missing")
+        assert len(requests_seen) == 1
@@ -0,0 +1,18 @@
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault.audit import AuditLog, AuditOperation
+
+
+class TestAuditLog:
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("read", AuditOperation.READ),
+            ("POLICY_WRITE", AuditOperation.POLICY_WRITE),
+            ("revoke", AuditOperation.REVOKE),
+            ("unknown", AuditOperation.READ),
+        ],
+    )
+    def test_parse_operation(self, value, expected):
+        assert AuditLog._parse_operation(value) is expected
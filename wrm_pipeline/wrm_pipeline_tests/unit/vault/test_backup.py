@@ -0,0 +1,115 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault import backup
+
+
+class TestSharedVaultClients:
+
+    @pytest.fixture(autouse=True)
+    def clients(self, monkeypatch):
+        """Empty client cache of two entries, building mock clients"""
+        clients = OrderedDict()
+        monkeypatch.setattr(backup, "_vault_clients", clients)
+        monkeypatch.setattr(backup, "_MAX_VAULT_CLIENTS", 2)
+        monkeypatch.setattr(
+            backup, "VaultClient", lambda config: MagicMock(config=config)
+        )
+        return clients
+
+    def test_same_credentials_share_a_client(self):
+        client = backup._vault_client("https://vault.test:8200", "token-a")
+
+        assert backup._vault_client("https://vault.test:8200", "token-a") is client
+
+    def test_cache_key_does_not_hold_the_token(self, clients):
+        backup._vault_client("https://vault.test:8200", "token-a")
+
+        assert "token-a" not in repr(list(clients))
+
+    def test_evicted_client_is_closed(self):
+        first = backup._vault_client("https://vault.test:8200", "token-a")
+        second = backup._vault_client("https://vault.test:8200", "token-b")
+        backup._vault_client("https://vault.test:8200", "token-a")
+
+        backup._vault_client("https://vault.test:8200", "token-c")
+
+        second.close.assert_called_once()
+        first.close.assert_not_called()
+
+
+def _done(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def _entry(snapshot_id, timestamp=None):
+    return backup.BackupHistoryEntry(
+        backup_type="daily",
+        timestamp=timestamp or datetime.now().isoformat(),
+        success=True,
+        snapshot_id=snapshot_id,
+    )
+
+
+class TestBackupSchedulerHistory:
+
+    @pytest.fixture
+    def scheduler(self):
+        scheduler = backup.BackupScheduler(MagicMock(), notify_on_failure=False)
+        scheduler._history_max = 3
+        yield scheduler
+        scheduler.close()
+
+    def test_verification_results_are_bounded(self, scheduler):
+        for i in range(10):
+            scheduler._on_verify_done(f"snap-{i}", _done(True))
+
+        assert list(scheduler._verified) == ["snap-7", "snap-8", "snap-9"]
+
+    def test_verification_results_apply_to_history(self, scheduler):
+        scheduler._record(_entry("snap-1"))
+        scheduler._on_verify_done("snap-1", _done(False))
+
+        (entry,) = scheduler.get_backup_history()
+
+        assert entry.verified is False
+
+    def _record_in_thread(self, scheduler, entries):
+        thread = threading.Thread(target=lambda: [scheduler._record(e) for e in entries])
+        thread.start()
+        thread.join()
+
+    def test_history_is_capped_across_threads(self, scheduler):
+        for i in range(3):
+            self._record_in_thread(
+                scheduler,
+                [_entry(f"snap-{i}{j}", f"2024-01-0{j + 1}T0{i}:00") for j in range(3)],
+            )
+
+        history = scheduler.get_backup_history(limit=100)
+
+        assert [e.snapshot_id for e in history] == ["snap-22", "snap-12", "snap-02"]
+
+    def test_stores_of_finished_threads_are_retired(self, scheduler):
+        self._record_in_thread(scheduler, [_entry("snap-1", "2024-01-01T00:00")])
+        scheduler._record(_entry("snap-2", "2024-01-02T00:00"))
+
+        assert len(scheduler._all_stores) == 1
+        history = scheduler.get_backup_history()
+        assert [e.snapshot_id for e in history] == ["snap-2", "snap-1"]
+
+    def test_stats_cover_the_oldest_entries_first(self, scheduler):
+        for day in range(1, 6):
+            scheduler._record(_entry(f"snap-{day}", f"2024-01-0{day}T00:00"))
+
+        stats = scheduler.get_backup_stats()
+
+        assert stats["total_backups"] == 3
+        assert stats["last_backup"].snapshot_id == "snap-5"
@@ -0,0 +1,175 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import MagicMock, patch
+from hvac.exceptions import InvalidPath
+
+from wrm_pipeline.wrm_pipeline.vault.client import VaultClient
+from wrm_pipeline.wrm_pipeline.vault.exceptions import VaultSecretNotFoundError
+from wrm_pipeline.wrm_pipeline.vault.models import VaultConnectionConfig
+
+
+class FakeKV:
+    """In-memory KV v2 engine answering the hvac calls VaultClient makes"""
+
+    def __init__(self):
+        self.secrets = {}
+        self.reads = []
+
+    def read_secret_version(self, path, version=None, mount_point=None, **kwargs):
+        self.reads.append((path, version))
+        versions = self.secrets.get(path)
+        if not versions or (version is not None and version > len(versions)):
+            raise InvalidPath()
+        number = version or len(versions)
+        return {"data": {"data": versions[number - 1], "metadata": {"version": number}}}
+
+    def create_or_update_secret(self, path, secret, mount_point=None, **kwargs):
+        self.secrets.setdefault(path, []).append(dict(secret))
+
+    def delete_metadata_and_all_versions(self, path, mount_point=None):
+        self.secrets.pop(path, None)
+
+
+class TestSecretCache:
+
+    @pytest.fixture
+    def kv(self):
+        return FakeKV()
+
+    @pytest.fixture
+    def client(self, kv):
+        """VaultClient talking to the in-memory KV engine, already authenticated"""
+        client = VaultClient(
+            VaultConnectionConfig(
+                vault_addr="https://vault.test:8200",
+                auth_method="token",
+                token="test-token",
+            )
+        )
+        hvac_client = MagicMock()
+        hvac_client.secrets.kv.v2 = kv
+        client._client = hvac_client
+        client._ready.set()
+        yield client
+        client.close()
+
+    def test_cached_read_is_served_without_a_request(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}]
+
+        client.get_secret("app/db")
+        client.get_secret("app/db")
+
+        assert len(kv.reads) == 1
+
+    @pytest.mark.parametrize("alias", ["secret/app/db", "secret/data/app/db"])
+    def test_mount_prefixed_paths_share_the_cache_entry(self, client, kv, alias):
+        kv.secrets["app/db"] = [{"user": "a"}]
+
+        client.get_secret("app/db")
+        client.get_secret(alias)
+
+        assert len(kv.reads) == 1
+
+    @pytest.mark.parametrize("write_path", ["b", "secret/b", "secret/data/b"])
+    def test_write_after_miss_makes_secret_readable(self, client, write_path):
+        with pytest.raises(VaultSecretNotFoundError):
+            client.get_secret("b")
+
+        client.write_secret(write_path, {"key": "value"})
+
+        assert client.get_secret("b").data == {"key": "value"}
+
+    def test_miss_is_negative_cached(self, client, kv):
+        for _ in range(2):
+            with pytest.raises(VaultSecretNotFoundError):
+                client.get_secret("missing")
+
+        assert len(kv.reads) == 1
+
+    def test_invalidate_cache_accepts_mount_prefixed_path(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}]
+        client.get_secret("app/db")
+
+        client.invalidate_cache("secret/data/app/db")
+        client.get_secret("app/db")
+
+        assert len(kv.reads) == 2
+
+    def test_missing_version_does_not_hide_latest_version(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}]
+
+        with pytest.raises(VaultSecretNotFoundError):
+            client.get_secret("app/db", version=99)
+
+        assert client.get_secret("app/db").data == {"user": "a"}
+
+    def test_delete_invalidates_entry_under_any_alias(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}]
+        client.get_secret("app/db")
+
+        client.delete_secret("secret/data/app/db")
+
+        with pytest.raises(VaultSecretNotFoundError):
+            client.get_secret("app/db")
+
+    def test_delete_then_write_drops_negative_entry(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}]
+        client.delete_secret("app/db")
+        with pytest.raises(VaultSecretNotFoundError):
+            client.get_secret("secret/app/db")
+
+        client.write_secret("app/db", {"user": "b"})
+
+        assert client.get_secret("secret/app/db").data == {"user": "b"}
+
+    def test_rotate_invalidates_entry_under_any_alias(self, client, kv):
+        kv.secrets["app/key"] = [{"api_key": "old"}]
+        client.get_secret("secret/data/app/key")
+
+        with patch(
+            "wrm_pipeline.wrm_pipeline.vault.client.RotationOrchestrator"
+        ) as orchestrator:
+            # Write the new value behind the client's back, as a handler would
+            orchestrator.return_value.rotate_secret.side_effect = (
+                lambda secret_path, secret_type: kv.create_or_update_secret(
+                    secret_path, {"api_key": "new"}
+                )
+            )
+            client.rotate_secret("app/key")
+
+        assert client.get_secret("secret/data/app/key").data == {"api_key": "new"}
+
+    def test_versioned_read_does_not_replace_latest(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}, {"user": "b"}]
+
+        assert client.get_secret("app/db", version=1).data == {"user": "a"}
+        assert client.get_secret("app/db").data == {"user": "b"}
+
+    def test_cached_latest_does_not_answer_versioned_read(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}, {"user": "b"}]
+        client.get_secret("app/db")
+
+        assert client.get_secret("app/db", version=1).data == {"user": "a"}
+
+    def test_concurrent_versioned_read_does_not_join_latest_read(self, client, kv):
+        kv.secrets["app/db"] = [{"user": "a"}, {"user": "b"}]
+        latest_started, release_latest = threading.Event(), threading.Event()
+        read = kv.read_secret_version
+
+        def slow_latest_read(path, version=None, **kwargs):
+            if version is None:
+                latest_started.set()
+                release_latest.wait(5)
+            return read(path, version=version, **kwargs)
+
+        kv.read_secret_version = slow_latest_read
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            latest = pool.submit(client.get_secret, "app/db")
+            latest_started.wait(5)
+            versioned = pool.submit(client.get_secret, "app/db", version=1)
+
+            assert versioned.result(timeout=5).data == {"user": "a"}
+            release_latest.set()
+            assert latest.result(timeout=5).data == {"user": "b"}
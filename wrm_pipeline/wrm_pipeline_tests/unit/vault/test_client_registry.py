@@ -0,0 +1,88 @@
+import gc
+import warnings
+
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault.client import _client_key, get_cached_client
+from wrm_pipeline.wrm_pipeline.vault.models import VaultConnectionConfig
+
+
+class TestGetCachedClient:
+
+    @pytest.fixture
+    def config(self):
+        """AppRole configuration for a test Vault server"""
+        return VaultConnectionConfig(
+            vault_addr="https://vault.test:8200",
+            auth_method="approle",
+            role_id="role-a",
+            secret_id="secret-a",
+        )
+
+    def test_identical_configs_share_a_client(self, config):
+        client = get_cached_client(config)
+        try:
+            assert get_cached_client(config.model_copy()) is client
+        finally:
+            client.close()
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"role_id": "role-b"},
+            {"secret_id": "secret-b"},
+            {"namespace": "team-b"},
+            {"verify": False},
+            {"cache_ttl": 10},
+            {"negative_cache_ttl": 0},
+        ],
+    )
+    def test_different_configs_get_different_clients(self, config, changes):
+        client = get_cached_client(config)
+        other = get_cached_client(config.model_copy(update=changes))
+        try:
+            assert other is not client
+        finally:
+            client.close()
+            other.close()
+
+    def test_token_configs_with_different_tokens_are_not_shared(self):
+        config = VaultConnectionConfig(
+            vault_addr="https://vault.test:8200",
+            auth_method="token",
+            token="token-a",
+        )
+        client = get_cached_client(config)
+        other = get_cached_client(config.model_copy(update={"token": "token-b"}))
+        try:
+            assert other is not client
+            assert other.config.token == "token-b"
+        finally:
+            client.close()
+            other.close()
+
+    def test_registry_key_does_not_hold_credentials(self, config):
+        key = repr(_client_key(config))
+        assert "role-a" not in key
+        assert "secret-a" not in key
+
+    def test_dropped_client_is_reused_without_rebuilding(self, config):
+        client_id = id(get_cached_client(config))
+        gc.collect()
+
+        client = get_cached_client(config)
+        try:
+            assert id(client) == client_id
+        finally:
+            client.close()
+
+    def test_registry_client_is_released_without_resource_warning(self, config):
+        client = get_cached_client(config)
+        client.client  # Opens the connection and registers the finalizer
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ResourceWarning)
+            # Run the finalizer as interpreter exit would
+            client._finalizer()
+
+        assert not client._finalizer.alive
@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from hvac.exceptions import VaultDown
+
+from wrm_pipeline.wrm_pipeline.vault.client import VaultClient
+from wrm_pipeline.wrm_pipeline.vault.exceptions import VaultConnectionError
+from wrm_pipeline.wrm_pipeline.vault.models import VaultConnectionConfig
+
+
+class TestRetries:
+
+    @pytest.fixture
+    def client(self):
+        """Authenticated VaultClient whose KV engine is a mock"""
+        client = VaultClient(
+            VaultConnectionConfig(
+                vault_addr="https://vault.test:8200",
+                auth_method="token",
+                token="test-token",
+                retries=3,
+            )
+        )
+        client._client = MagicMock()
+        client._ready.set()
+        yield client
+        client.close()
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self):
+        with patch("wrm_pipeline.wrm_pipeline.vault.client.time.sleep"):
+            yield
+
+    def test_read_is_retried_on_transient_error(self, client):
+        kv = client.client.secrets.kv.v2
+        kv.read_secret_version.side_effect = [
+            VaultDown(),
+            {"data": {"data": {"key": "value"}, "metadata": {"version": 1}}},
+        ]
+
+        assert client.get_secret("app/db").data == {"key": "value"}
+        assert kv.read_secret_version.call_count == 2
+
+    def test_write_is_not_retried(self, client):
+        kv = client.client.secrets.kv.v2
+        kv.create_or_update_secret.side_effect = VaultDown()
+
+        with pytest.raises(VaultConnectionError):
+            client.write_secret("app/db", {"key": "value"})
+
+        kv.create_or_update_secret.assert_called_once()
+
+    def test_delete_is_not_retried(self, client):
+        kv = client.client.secrets.kv.v2
+        kv.delete_metadata_and_all_versions.side_effect = VaultDown()
+
+        with pytest.raises(VaultConnectionError):
+            client.delete_secret("app/db")
+
+        kv.delete_metadata_and_all_versions.assert_called_once()
+
+    def test_http_session_only_resends_reads(self, client):
+        with client._create_session() as session:
+            retry = session.get_adapter("https://").max_retries
+
+        assert retry.is_retry("GET", 502)
+        assert not retry.is_retry("POST", 502)
+        assert not retry.is_retry("DELETE", 502)
@@ -0,0 +1,41 @@
+import pytest
+import requests
+
+from wrm_pipeline.wrm_pipeline.vault.client import VaultClient
+from wrm_pipeline.wrm_pipeline.vault.models import VaultConnectionConfig
+
+
+class TestSuppliedHttpSession:
+
+    @pytest.fixture
+    def config(self):
+        return VaultConnectionConfig(
+            vault_addr="https://vault.test:8200",
+            auth_method="token",
+            token="test-token",
+        )
+
+    @pytest.fixture
+    def session(self):
+        session = requests.Session()
+        yield session
+        session.close()
+
+    def test_session_disabling_verification_is_rejected(self, config, session):
+        session.verify = False
+
+        with pytest.raises(ValueError):
+            VaultClient(config, http_session=session)
+
+    def test_session_verifying_when_disabled_is_rejected(self, config, session):
+        with pytest.raises(ValueError):
+            VaultClient(config, verify=False, http_session=session)
+
+    @pytest.mark.parametrize("verify", [True, "/etc/ssl/certs/ca.pem"])
+    def test_matching_session_is_used_as_given(self, config, session, verify):
+        session.verify = verify
+
+        with VaultClient(config, http_session=session) as client:
+            client.client
+
+            assert client._session is session
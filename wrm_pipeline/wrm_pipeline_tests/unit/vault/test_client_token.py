@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault import client as client_module
+from wrm_pipeline.wrm_pipeline.vault.client import VaultClient
+from wrm_pipeline.wrm_pipeline.vault.models import VaultConnectionConfig
+
+
+class TestSharedAppRoleToken:
+
+    @pytest.fixture(autouse=True)
+    def empty_token_cache(self, monkeypatch):
+        monkeypatch.setattr(client_module, "_token_cache", {})
+        monkeypatch.setattr(client_module, "_token_holders", {})
+
+    @pytest.fixture
+    def logins(self):
+        """Tokens handed out by successive AppRole logins"""
+        return iter(["token-1", "token-2", "token-3"])
+
+    @pytest.fixture
+    def make_client(self, logins):
+        """Build AppRole clients whose hvac client is a mock"""
+        clients = []
+
+        def make_client(**changes):
+            client = VaultClient(
+                VaultConnectionConfig(
+                    vault_addr="https://vault.test:8200",
+                    auth_method="approle",
+                    role_id="role-a",
+                    secret_id="secret-a",
+                    **changes,
+                )
+            )
+            hvac_client = MagicMock()
+            hvac_client.auth.approle.login.side_effect = lambda **kwargs: {
+                "auth": {"client_token": next(logins), "lease_duration": 0}
+            }
+            client._client = hvac_client
+            clients.append(client)
+            return client
+
+        yield make_client
+        for client in clients:
+            client.close()
+
+    def test_clients_of_one_role_share_a_login(self, make_client):
+        first, second = make_client(), make_client()
+
+        first._ensure_authenticated()
+        second._ensure_authenticated()
+
+        assert first.client.token == second.client.token == "token-1"
+        second.client.auth.approle.login.assert_not_called()
+
+    def test_namespaces_do_not_share_a_login(self, make_client):
+        first = make_client(namespace="team-a")
+        second = make_client(namespace="team-b")
+
+        first._ensure_authenticated()
+        second._ensure_authenticated()
+
+        assert first.client.token != second.client.token
+
+    def test_close_does_not_revoke_token_used_by_another_client(self, make_client):
+        first, second = make_client(), make_client()
+        first._ensure_authenticated()
+        second._ensure_authenticated()
+        hvac_client = first.client
+
+        first.close(revoke=True)
+
+        hvac_client.auth.token.self_revoke.assert_not_called()
+        assert second._is_authenticated()
+
+    def test_last_client_revokes_the_shared_token(self, make_client):
+        first, second = make_client(), make_client()
+        first._ensure_authenticated()
+        second._ensure_authenticated()
+        hvac_client = second.client
+        first.close(revoke=True)
+
+        second.close(revoke=True)
+
+        hvac_client.auth.token.self_revoke.assert_called_once()
+        assert client_module._token_cache == {}
@@ -0,0 +1,98 @@
+import copy
+import pickle
+from datetime import datetime, timedelta
+from types import MappingProxyType
+
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault.models import (
+    RotationType,
+    Secret,
+    SecretRotationPolicy,
+    VaultSecret,
+)
+
+
+class TestVaultSecret:
+
+    @pytest.fixture
+    def secret(self):
+        return VaultSecret(path="app/db", data={"user": {"name": "a"}}, version=2)
+
+    def test_data_is_read_only(self, secret):
+        with pytest.raises(TypeError):
+            secret.data["user"] = "b"
+
+    def test_pickle_round_trip_keeps_data_read_only(self, secret):
+        restored = pickle.loads(pickle.dumps(secret))
+
+        assert restored == secret
+        assert isinstance(restored.data, MappingProxyType)
+
+    @pytest.mark.parametrize(
+        "copier",
+        [copy.deepcopy, lambda secret: secret.model_copy(deep=True)],
+    )
+    def test_deep_copy_does_not_share_nested_data(self, secret, copier):
+        copied = copier(secret)
+
+        assert copied == secret
+        assert isinstance(copied.data, MappingProxyType)
+        assert copied.data["user"] is not secret.data["user"]
+
+    def test_mappingproxy_pickling_is_not_changed_globally(self):
+        with pytest.raises(TypeError):
+            pickle.dumps(MappingProxyType({}))
+
+
+class TestSecret:
+
+    def test_dump_validates_back(self):
+        secret = Secret(
+            path="bike-data-flow/production/database",
+            data={"user": "a", "port": 5432},
+            created_time=datetime(2024, 1, 1),
+        )
+
+        restored = Secret.model_validate(secret.model_dump())
+
+        assert restored.data == {"user": "a", "port": 5432}
+        assert restored == secret
+
+    def test_json_round_trip(self):
+        secret = Secret(
+            path="bike-data-flow/production/database",
+            data={"user": "a"},
+            created_time=datetime(2024, 1, 1),
+        )
+
+        restored = Secret.model_validate_json(secret.model_dump_json())
+
+        assert restored.data == {"user": "a"}
+
+
+class TestSecretRotationPolicy:
+
+    @pytest.fixture
+    def policy(self):
+        return SecretRotationPolicy(
+            secret_path="bike-data-flow/production/api-key",
+            rotation_type=RotationType.SCHEDULED,
+            rotation_period_days=30,
+            last_rotated=datetime(2024, 1, 1),
+        )
+
+    def test_next_rotation_follows_last_rotation(self, policy):
+        assert policy.next_rotation == datetime(2024, 1, 31)
+
+        policy.last_rotated = datetime(2024, 2, 1)
+
+        assert policy.next_rotation == datetime(2024, 2, 1) + timedelta(days=30)
+
+    def test_dump_validates_back(self, policy):
+        dumped = policy.model_dump()
+
+        restored = SecretRotationPolicy.model_validate(dumped)
+
+        assert "next_rotation" in dumped
+        assert restored.next_rotation == policy.next_rotation
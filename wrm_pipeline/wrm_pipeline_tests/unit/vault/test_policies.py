@@ -0,0 +1,89 @@
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault.models import AccessPolicy, PolicyRule
+from wrm_pipeline.wrm_pipeline.vault.policies import PolicyManager, PolicyValidationError
+
+
+class TestPolicyRule:
+
+    def test_capabilities_are_immutable(self):
+        rule = PolicyRule(path="secret/data/app/*", capabilities=["read", "list"])
+
+        assert rule.capabilities == ("read", "list")
+        with pytest.raises(AttributeError):
+            rule.capabilities.append("sudo")
+
+
+class TestGeneratedPolicies:
+
+    @pytest.fixture
+    def manager(self):
+        return PolicyManager()
+
+    def test_generated_policies_share_unchangeable_rules(self, manager):
+        policy = manager.generate_readonly_policy("bike-data-flow/production")
+
+        with pytest.raises(AttributeError):
+            policy.rules[0].capabilities.append("sudo")
+
+        regenerated = manager.generate_readonly_policy("bike-data-flow/production")
+        assert "sudo" not in manager.to_hcl(regenerated)
+
+    def test_validated_policy_cannot_change_behind_the_memo(self, manager):
+        policy = manager.generate_admin_policy("secret/data/app")
+        manager.validate_policy(policy)
+        key = policy.structural_key
+
+        with pytest.raises(AttributeError):
+            policy.rules[0].capabilities.remove("sudo")
+
+        assert policy.structural_key == key
+        assert "sudo" in manager.to_hcl(manager.generate_admin_policy("secret/data/app"))
+
+    def test_memo_does_not_accept_a_different_policy(self, manager):
+        valid = AccessPolicy(
+            name="app",
+            rules=[PolicyRule(path="secret/data/app/*", capabilities=["read"])],
+        )
+        manager.validate_policy(valid)
+        invalid = AccessPolicy(
+            name="app",
+            rules=[PolicyRule(path="secret/data/../*", capabilities=["read"])],
+        )
+
+        with pytest.raises(PolicyValidationError):
+            manager.validate_policy(invalid)
+
+    def test_hcl_rejects_unvalidated_capabilities(self, manager):
+        rule = PolicyRule.model_construct(
+            path="secret/data/app/*",
+            capabilities=('read"] }\npath "sys/*" { capabilities = ["sudo',),
+            description=None,
+        )
+        policy = AccessPolicy.model_construct(
+            name="app", description=None, rules=(rule,)
+        )
+
+        with pytest.raises(ValueError):
+            manager.to_hcl(policy)
+
+
+class TestHcl:
+
+    @pytest.fixture
+    def manager(self):
+        return PolicyManager()
+
+    def test_generated_policy_round_trips_through_hcl(self, manager):
+        policy = manager.generate_dagster_policy("secret/data/bike-data-flow")
+
+        parsed = manager.parse_hcl(manager.to_hcl(policy))
+
+        assert parsed.name == policy.name
+        assert [(r.path, r.capabilities) for r in parsed.rules] == [
+            (r.path, r.capabilities) for r in policy.rules
+        ]
+
+    def test_hcl_without_policy_name_is_rejected(self, manager):
+        with pytest.raises(PolicyValidationError):
+            manager.parse_hcl('path "secret/*" {\n  capabilities = ["read"]\n}')
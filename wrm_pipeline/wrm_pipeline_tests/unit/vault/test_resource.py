@@ -0,0 +1,174 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault.models import VaultSecret
+from wrm_pipeline.wrm_pipeline.vault.resource import (
+    VaultSecretsResource,
+    VaultSecretsResourceConfig,
+)
+
+
+class FakeAsyncClient:
+    """Async client recording the event loop it is used and closed on"""
+
+    instances = []
+
+    def __init__(self, client):
+        self.loop = None
+        self.closed_on = None
+        FakeAsyncClient.instances.append(self)
+
+    async def aget_secret(self, path):
+        self.loop = asyncio.get_running_loop()
+        return VaultSecret(path=path, data={"key": "value"}, version=1)
+
+    async def aclose(self):
+        self.closed_on = asyncio.get_running_loop()
+
+
+class TestVaultSecretsResourceAsync:
+
+    @pytest.fixture
+    def resource(self):
+        """Resource whose async clients are recorded instead of opened"""
+        FakeAsyncClient.instances = []
+        resource = VaultSecretsResource(
+            VaultSecretsResourceConfig(auth_method="token", token="test-token")
+        )
+        resource._client = MagicMock()
+        with patch(
+            "wrm_pipeline.wrm_pipeline.vault.resource.AsyncVaultClient",
+            FakeAsyncClient,
+        ):
+            yield resource
+
+    def test_each_event_loop_gets_its_own_client(self, resource):
+        async def read(path):
+            await resource.aget_secret(path, use_cache=False)
+            await resource.aget_secret(path, use_cache=False)
+            await resource.aclose()
+
+        asyncio.run(read("app/a"))
+        asyncio.run(read("app/b"))
+
+        first, second = FakeAsyncClient.instances
+        assert first.loop is not second.loop
+
+    def test_aclose_closes_the_client_on_its_loop(self, resource):
+        async def read():
+            await resource.aget_secret("app/db")
+            await resource.aclose()
+            return asyncio.get_running_loop()
+
+        loop = asyncio.run(read())
+
+        (async_client,) = FakeAsyncClient.instances
+        assert async_client.closed_on is loop
+        assert resource._async_clients == {}
+
+    def test_close_closes_client_of_an_idle_loop(self, resource):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(resource.aget_secret("app/db"))
+
+            resource.close()
+
+            (async_client,) = FakeAsyncClient.instances
+            assert async_client.closed_on is loop
+        finally:
+            loop.close()
+
+    def test_close_closes_client_of_a_running_loop(self, resource):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(
+                resource.aget_secret("app/db"), loop
+            ).result(timeout=5)
+
+            resource.close()
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), loop).result(timeout=5)
+
+            (async_client,) = FakeAsyncClient.instances
+            assert async_client.closed_on is loop
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_client_of_a_closed_loop_is_dropped(self, resource, caplog):
+        asyncio.run(resource.aget_secret("app/db"))
+
+        resource.close()
+
+        assert resource._async_clients == {}
+        assert "aclose()" in caplog.text
+
+    def test_teardown_closes_the_resource(self, resource):
+        client = resource._client
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(resource.aget_secret("app/db"))
+
+            resource.teardown_after_execution(context=None)
+
+            assert FakeAsyncClient.instances[0].closed_on is loop
+            client.close.assert_called_once()
+            assert resource._client is None
+        finally:
+            loop.close()
+
+
+class TestVaultSecretsResourceCache:
+
+    @pytest.fixture
+    def resource(self):
+        """Resource with a two-entry cache over a mock Vault client"""
+        resource = VaultSecretsResource(
+            VaultSecretsResourceConfig(
+                auth_method="token", token="test-token", cache_max_entries=2
+            )
+        )
+        resource._client = MagicMock()
+        resource._client.get_secret.side_effect = lambda path, **kwargs: VaultSecret(
+            path=path, data={"path": path}, version=1
+        )
+        return resource
+
+    def test_cached_secret_is_read_once(self, resource):
+        resource.get_secret("app/db")
+
+        assert resource.get_secret("app/db") == {"path": "app/db"}
+        resource._client.get_secret.assert_called_once()
+
+    def test_least_recently_used_entry_is_evicted(self, resource):
+        for path in ("app/a", "app/b", "app/a", "app/c"):
+            resource.get_secret(path)
+
+        assert list(resource._cache) == ["app/a", "app/c"]
+
+    def test_concurrent_misses_fetch_once(self, resource):
+        started, release = threading.Event(), threading.Event()
+        fetch = resource._client.get_secret.side_effect
+
+        def slow_fetch(path, **kwargs):
+            started.set()
+            release.wait(5)
+            return fetch(path, **kwargs)
+
+        resource._client.get_secret.side_effect = slow_fetch
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(resource.get_secret, "app/db")
+            started.wait(5)
+            others = [pool.submit(resource.get_secret, "app/db") for _ in range(3)]
+            release.set()
+            results = [f.result(timeout=5) for f in [first, *others]]
+
+        assert all(result == {"path": "app/db"} for result in results)
+        resource._client.get_secret.assert_called_once()
+        assert resource._fetch_locks == {}
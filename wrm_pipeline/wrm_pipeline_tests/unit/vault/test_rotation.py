@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from wrm_pipeline.wrm_pipeline.vault.models import (
+    RotationStatus,
+    RotationType,
+    SecretRotationPolicy,
+)
+from wrm_pipeline.wrm_pipeline.vault.rotation import (
+    RotationHistoryTracker,
+    RotationScheduler,
+)
+
+
+class TestRotationHistoryTracker:
+
+    def test_recorded_history_stores_enum_values(self):
+        tracker = RotationHistoryTracker()
+
+        history = tracker.record_rotation(
+            secret_path="app/key",
+            rotation_type=RotationType.MANUAL,
+            status=RotationStatus.SUCCESS,
+        )
+
+        assert history.rotation_type == RotationType.MANUAL.value
+        assert history.status == RotationStatus.SUCCESS.value
+        assert history.metadata == {}
+        assert tracker.get_history("app/key") == [history]
+
+
+class TestRotationScheduler:
+
+    @pytest.fixture
+    def scheduler(self):
+        return RotationScheduler()
+
+    def test_schedule_follows_the_last_rotation(self, scheduler):
+        last_rotated = datetime.utcnow() - timedelta(days=40)
+        policy = SecretRotationPolicy(
+            secret_path="app/key",
+            rotation_type=RotationType.SCHEDULED,
+            rotation_period_days=30,
+            last_rotated=last_rotated,
+        )
+
+        scheduler.schedule_rotation(policy)
+
+        assert scheduler.get_due_rotations() == [policy]
+
+    def test_scheduling_does_not_change_the_policy(self, scheduler):
+        policy = SecretRotationPolicy(
+            secret_path="app/key",
+            rotation_type=RotationType.SCHEDULED,
+            rotation_period_days=30,
+        )
+        dumped = policy.model_dump()
+
+        scheduler.schedule_rotation(policy)
+
+        assert policy.model_dump() == dumped
+        assert scheduler.get_due_rotations() == []